@@ -0,0 +1,52 @@
+"""Shared fixtures for the manual Xueqiu Playwright scripts in the project root.
+
+The scripts hit the live site and are outside ``testpaths``; run them explicitly, e.g.
+``pytest test_xueqiu_manual.py``.
+"""
+
+from __future__ import annotations
+
+import inspect
+from pathlib import Path
+
+import pytest
+
+try:  # optional: only the manual browser scripts need these
+    import pytest_asyncio
+    from playwright.async_api import async_playwright
+except ImportError:  # pragma: no cover - import guard
+    pytest_asyncio = None
+    async_playwright = None
+
+_ROOT = Path(__file__).resolve().parent
+
+
+if pytest_asyncio is not None and async_playwright is not None:
+
+    @pytest_asyncio.fixture(scope="session")
+    async def browser():
+        """One headless Chromium per test session; each script opens its own context."""
+        async with async_playwright() as p:
+            instance = await p.chromium.launch(headless=True)
+            try:
+                yield instance
+            finally:
+                await instance.close()
+
+else:
+
+    @pytest.fixture(scope="session")
+    def browser():
+        pytest.skip("playwright and pytest-asyncio are required for the browser scripts")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    # 根目录脚本的协程用例与会话级浏览器共用同一个事件循环
+    for item in items:
+        function = getattr(item, "function", None)
+        if (
+            function is not None
+            and inspect.iscoroutinefunction(function)
+            and Path(str(item.fspath)).parent == _ROOT
+        ):
+            item.add_marker(pytest.mark.asyncio(scope="session"))
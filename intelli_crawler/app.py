@@ -251,6 +251,8 @@ def build_state(verbose: bool) -> AppState:
         proxy_pool=proxy_pool,
         ua_pool=ua_pool,
     )
+    # 共享的 Fetcher 连接池在进程退出时统一关闭
+    _atexit.register(orchestrator.close)
     wizard = ConfigWizard(repository)
     configure_logging(verbose=verbose)
     return AppState(
@@ -514,6 +516,8 @@ def source_remove(
     except FileNotFoundError:
         # delete_source 本身已做存在性判断，一般不会抛异常；留作防御
         pass
+    # 释放该源缓存的配置与 Fetcher（连接池、浏览器会话）
+    state.orchestrator.forget_source(name)
 
     if source_path.exists():
         console.print(f"未找到信息源 `{name}`。", style="red")
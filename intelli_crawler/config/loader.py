@@ -74,7 +74,9 @@ class ConfigLocator:
             self.sources_dir,
             self.logs_dir,
         ):
-            directory.mkdir(parents=True, exist_ok=True)
+            # 已存在的目录只需一次 stat，跳过 mkdir
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
 
     def global_config_path(self) -> Path:
         return self.data_dir / GLOBAL_CONFIG_FILENAME
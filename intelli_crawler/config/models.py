@@ -7,7 +7,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Literal, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 
 class SiteType(str, Enum):
@@ -198,6 +198,8 @@ class SourceConfig(BaseModel):
     anti_scraping_strategies: AntiScrapingStrategies = Field(default_factory=AntiScrapingStrategies)
     enable_incremental: bool = True
     use_entry_content: bool = False
+    # 是否在详情记录中保留整页 HTML（raw_html）；关闭可显著降低内存与导出体积
+    keep_raw_html: bool = True
     deduplication: DeduplicationConfig = Field(default_factory=DeduplicationConfig)
 
     # Entry page interactions for dynamic content (optional)
@@ -236,6 +238,10 @@ class SourceConfig(BaseModel):
 
     entry_interactions: EntryInteractions = Field(default_factory=EntryInteractions)
 
+    # 解析器预编译的 detail_pattern 缓存：(detail_pattern 对象, 编译结果)，
+    # 以对象身份校验，model_copy(update=...) 替换 detail_pattern 后自动失效
+    _compiled_detail: tuple[Any, Any] | None = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def _validate_patterns(self) -> "SourceConfig":
         if self.crawl_depth < 1:
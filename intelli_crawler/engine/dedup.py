@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import hashlib
+import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 from threading import Lock
-from typing import Tuple
+from typing import Iterable, Tuple
 
 from ..infra.storage import SQLiteManager
 
+# SQLite 默认的绑定参数上限较低（旧版本 999），IN 查询按此分块
+_IN_CHUNK_SIZE = 500
+
 
 @dataclass
 class DeduplicationResult:
@@ -36,29 +40,80 @@ class DeduplicationStore:
         self.enable_url = enable_url
         self.enable_content = enable_content
         self._lock = Lock()
-        self._conn = self.manager.connect(db_path)
+        self.manager.connect(db_path)
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        # SQLiteManager 按线程缓存连接，这里每次取当前线程的连接
+        return self.manager.connect(self.db_path)
 
     def check_and_store(self, url: str, content: str, source_name: str) -> DeduplicationResult:
         url_dup = False
         content_dup = False
         content_hash = self._hash(content)
+        conn = self._conn
         with self._lock:
             if self.enable_url:
-                cur = self._conn.execute("SELECT 1 FROM crawl_history WHERE url = ?", (url,))
+                cur = conn.execute("SELECT 1 FROM crawl_history WHERE url = ?", (url,))
                 url_dup = cur.fetchone() is not None
             if self.enable_content:
-                cur = self._conn.execute(
+                cur = conn.execute(
                     "SELECT 1 FROM crawl_history WHERE content_hash = ?", (content_hash,)
                 )
                 content_dup = cur.fetchone() is not None
             if not (url_dup or content_dup):
-                self._conn.execute(
+                conn.execute(
                     "INSERT OR REPLACE INTO crawl_history(url, content_hash, timestamp, source_name) VALUES (?, ?, datetime('now'), ?)",
                     (url, content_hash, source_name),
                 )
-                self._conn.commit()
+                conn.commit()
         return DeduplicationResult(url_dup, content_dup)
 
+    def check_and_store_many(
+        self, items: Iterable[tuple[str, str, str]]
+    ) -> list[DeduplicationResult]:
+        """Batch variant of :meth:`check_and_store` for ``(url, content, source_name)`` items.
+
+        Known URLs/hashes are fetched with chunked ``IN`` queries and all new rows are
+        committed in one transaction. Results are in input order and identical to calling
+        :meth:`check_and_store` once per item.
+        """
+
+        entries = [(url, self._hash(content), source_name) for url, content, source_name in items]
+        conn = self._conn
+        results: list[DeduplicationResult] = []
+        with self._lock:
+            known_urls = (
+                self._select_in(conn, "url", (entry[0] for entry in entries))
+                if self.enable_url
+                else set()
+            )
+            known_hashes = (
+                self._select_in(conn, "content_hash", (entry[1] for entry in entries))
+                if self.enable_content
+                else set()
+            )
+            rows: list[tuple[str, str, str]] = []
+            for url, content_hash, source_name in entries:
+                url_dup = self.enable_url and url in known_urls
+                content_dup = self.enable_content and content_hash in known_hashes
+                results.append(DeduplicationResult(url_dup, content_dup))
+                if not (url_dup or content_dup):
+                    rows.append((url, content_hash, source_name))
+                    known_urls.add(url)
+                    known_hashes.add(content_hash)
+            if rows:
+                self.manager.insert_many(conn, rows)
+        return results
+
+    def discard(self, url: str) -> None:
+        """Forget ``url`` so a record whose export failed is crawled again next time."""
+
+        conn = self._conn
+        with self._lock:
+            conn.execute("DELETE FROM crawl_history WHERE url = ?", (url,))
+            conn.commit()
+
     def has_url(self, url: str) -> bool:
         if not self.enable_url:
             return False
@@ -66,12 +121,36 @@ class DeduplicationStore:
             cur = self._conn.execute("SELECT 1 FROM crawl_history WHERE url = ?", (url,))
             return cur.fetchone() is not None
 
+    def has_urls(self, urls: Iterable[str]) -> set[str]:
+        """Return the subset of ``urls`` already recorded, using chunked ``IN`` queries."""
+
+        if not self.enable_url:
+            return set()
+        conn = self._conn
+        with self._lock:
+            return self._select_in(conn, "url", urls)
+
+    @staticmethod
+    def _select_in(conn: sqlite3.Connection, column: str, values: Iterable[str]) -> set[str]:
+        pending = list(dict.fromkeys(values))
+        seen: set[str] = set()
+        for offset in range(0, len(pending), _IN_CHUNK_SIZE):
+            chunk = pending[offset : offset + _IN_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            cur = conn.execute(
+                f"SELECT {column} FROM crawl_history WHERE {column} IN ({placeholders})", chunk
+            )
+            seen.update(row[0] for row in cur.fetchall())
+        return seen
+
     def reset(self) -> None:
         self.manager.reset(self.db_path)
-        self._conn = self.manager.connect(self.db_path)
+        self.manager.connect(self.db_path)
 
     @staticmethod
     def _hash(content: str) -> str:
+        # 固定使用 sha256：历史库中已有的指纹都是 sha256，算法不能随可选依赖变化，
+        # 否则不同主机或装了新包后的内容去重会与既有记录对不上
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
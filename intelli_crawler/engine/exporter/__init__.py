@@ -1,8 +1,16 @@
 """Exporter SPI and implementations."""
 
-from .base import BaseExporter
+from .base import BaseExporter, ExportError
 from .file_exporter import FileExporter
 from .mongo_exporter import MongoExporter
+from .queued_exporter import QueuedExporter
 from .sqlite_exporter import SQLiteExporter
 
-__all__ = ["BaseExporter", "FileExporter", "MongoExporter", "SQLiteExporter"]
+__all__ = [
+    "BaseExporter",
+    "ExportError",
+    "FileExporter",
+    "MongoExporter",
+    "QueuedExporter",
+    "SQLiteExporter",
+]
@@ -3,9 +3,23 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from typing import Iterable
 
 
+class ExportError(Exception):
+    """Raised when some records of a batch could not be written.
+
+    ``failed`` maps the index of each failed record within the batch to its error; every
+    other record of the batch was written.
+    """
+
+    def __init__(self, failed: dict[int, BaseException]) -> None:
+        first = next(iter(failed.values()), None)
+        super().__init__(f"{len(failed)} record(s) failed to export: {first}")
+        self.failed = failed
+
+
 class BaseExporter(ABC):
     """Uniform exporter contract enabling plug-and-play outputs."""
 
@@ -14,8 +28,26 @@ class BaseExporter(ABC):
         """Persist a single record."""
 
     def export_many(self, records: Iterable[dict]) -> None:
-        for record in records:
+        """Persist ``records``, raising :class:`ExportError` for the ones that failed."""
+        failed: dict[int, BaseException] = {}
+        for index, record in enumerate(records):
+            try:
+                self.export(record)
+            except Exception as exc:  # noqa: BLE001
+                failed[index] = exc
+        if failed:
+            raise ExportError(failed)
+
+    def submit(self, record: dict) -> Future[None]:
+        """Export ``record`` and return a future resolving once it is written."""
+        future: Future[None] = Future()
+        try:
             self.export(record)
+        except Exception as exc:  # noqa: BLE001
+            future.set_exception(exc)
+        else:
+            future.set_result(None)
+        return future
 
     @abstractmethod
     def flush(self) -> None:
@@ -26,4 +58,4 @@ class BaseExporter(ABC):
         """Release underlying resources."""
 
 
-__all__ = ["BaseExporter"]
+__all__ = ["BaseExporter", "ExportError"]
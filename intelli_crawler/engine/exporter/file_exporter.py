@@ -7,9 +7,9 @@ import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
-from .base import BaseExporter
+from .base import BaseExporter, ExportError
 
 
 class FileExporter(BaseExporter):
@@ -53,6 +53,23 @@ class FileExporter(BaseExporter):
             if not formatted.endswith("\n"):
                 self._file.write("\n")
 
+    def export_many(self, records: Iterable[dict]) -> None:
+        if self.format != "json":
+            super().export_many(records)
+            return
+        # 逐条序列化，单条失败只丢弃该条；成功的行整批一次写入
+        lines: list[str] = []
+        failed: dict[int, BaseException] = {}
+        for index, record in enumerate(records):
+            try:
+                lines.append(json.dumps(record, ensure_ascii=False))
+            except (TypeError, ValueError) as exc:
+                failed[index] = exc
+        if lines:
+            self._file.write("\n".join(lines) + "\n")
+        if failed:
+            raise ExportError(failed)
+
     def flush(self) -> None:
         self._file.flush()
 
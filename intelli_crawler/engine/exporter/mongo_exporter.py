@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 
-from .base import BaseExporter
+from .base import BaseExporter, ExportError
 
 try:  # noqa: SIM105
     from pymongo import MongoClient
+    from pymongo.errors import BulkWriteError
 except Exception as exc:  # noqa: BLE001
     MongoClient = None  # type: ignore[assignment]
+    BulkWriteError = None  # type: ignore[assignment,misc]
     _IMPORT_ERROR = exc
 else:
     _IMPORT_ERROR = None
@@ -27,6 +29,22 @@ class MongoExporter(BaseExporter):
     def export(self, record: dict) -> None:
         self.collection.insert_one(record)
 
+    def export_many(self, records: Iterable[dict]) -> None:
+        documents = list(records)
+        if not documents:
+            return
+        try:
+            self.collection.insert_many(documents, ordered=False)
+        except BulkWriteError as exc:
+            # ordered=False 时其余文档已写入，只报告失败的下标
+            failed = {
+                error["index"]: RuntimeError(error.get("errmsg", "write error"))
+                for error in exc.details.get("writeErrors", [])
+            }
+            if not failed:
+                raise
+            raise ExportError(failed) from exc
+
     def flush(self) -> None:
         # MongoDB writes are immediate in default write concern
         return
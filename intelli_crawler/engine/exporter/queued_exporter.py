@@ -0,0 +1,122 @@
+"""Background-thread exporter decorator batching writes off the crawl path."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Iterable, Optional, Tuple
+
+import structlog
+
+from .base import BaseExporter, ExportError
+
+_STOP = object()
+
+
+class QueuedExporter(BaseExporter):
+    """Queue records for a single writer thread that forwards them in batches.
+
+    ``export`` only enqueues (blocking when ``maxsize`` records are pending), so worker
+    threads never wait on file/Mongo/SQLite I/O. ``submit`` also returns a future that
+    settles once the record is written, or fails with that record's own error. ``flush``
+    waits for the queue to drain; ``close`` stops the writer and closes the wrapped
+    exporter. Both raise :class:`ExportError` for records queued via ``export`` that failed.
+    """
+
+    def __init__(self, inner: BaseExporter, maxsize: int = 1024, batch_size: int = 64) -> None:
+        self.inner = inner
+        self.batch_size = batch_size
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=maxsize)
+        self._logger = structlog.get_logger("intelli_crawler.exporter")
+        self._closed = False
+        # export() 入队的记录没有 future，其失败在 flush/close 时抛出
+        self._errors: list[BaseException] = []
+        self._errors_lock = threading.Lock()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="exporter-writer", daemon=True
+        )
+        self._writer.start()
+
+    def export(self, record: dict) -> None:
+        self._queue.put((record, None))
+
+    def export_many(self, records: Iterable[dict]) -> None:
+        for record in records:
+            self._queue.put((record, None))
+
+    def submit(self, record: dict) -> Future[None]:
+        future: Future[None] = Future()
+        self._queue.put((record, future))
+        return future
+
+    def flush(self) -> None:
+        self._queue.join()
+        self.inner.flush()
+        self._raise_pending_errors()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+        self.inner.close()
+        self._raise_pending_errors()
+
+    def _raise_pending_errors(self) -> None:
+        with self._errors_lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise ExportError(dict(enumerate(errors)))
+
+    def _write_batch(self, batch: list[Tuple[dict, Optional[Future[None]]]]) -> None:
+        failed: dict[int, BaseException] = {}
+        try:
+            self.inner.export_many([record for record, _future in batch])
+        except ExportError as exc:
+            failed = exc.failed
+        except Exception as exc:  # noqa: BLE001
+            failed = dict.fromkeys(range(len(batch)), exc)
+        if failed:
+            first = next(iter(failed.values()))
+            self._logger.error(
+                "export_batch_failed", size=len(batch), failed=len(failed), error=str(first)
+            )
+        for index, (_record, future) in enumerate(batch):
+            error = failed.get(index)
+            if future is not None:
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+            elif error is not None:
+                with self._errors_lock:
+                    self._errors.append(error)
+
+    def _writer_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch: list[Tuple[dict, Optional[Future[None]]]] = []
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)  # type: ignore[arg-type]
+            # 尽量凑满一批再写，队列空时立即落盘当前批次
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)  # type: ignore[arg-type]
+            if batch:
+                self._write_batch(batch)
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+            if stop:
+                return
+
+
+__all__ = ["QueuedExporter"]
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Iterable
 
 import sqlite3
 
-from .base import BaseExporter
+from .base import BaseExporter, ExportError
 
 
 class SQLiteExporter(BaseExporter):
@@ -17,7 +18,8 @@ class SQLiteExporter(BaseExporter):
         self.path = path
         self.table = table
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(self.path)
+        # 写入可能来自后台写线程，而连接在调度线程创建
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
         self.conn.execute(
             f"""
             CREATE TABLE IF NOT EXISTS {self.table} (
@@ -34,6 +36,20 @@ class SQLiteExporter(BaseExporter):
             (json.dumps(record, ensure_ascii=False),),
         )
 
+    def export_many(self, records: Iterable[dict]) -> None:
+        # 先逐条序列化，避免一条坏记录让 executemany 中途失败而丢掉整批
+        rows: list[tuple[str]] = []
+        failed: dict[int, BaseException] = {}
+        for index, record in enumerate(records):
+            try:
+                rows.append((json.dumps(record, ensure_ascii=False),))
+            except (TypeError, ValueError) as exc:
+                failed[index] = exc
+        if rows:
+            self.conn.executemany(f"INSERT INTO {self.table}(payload) VALUES (?)", rows)
+        if failed:
+            raise ExportError(failed)
+
     def flush(self) -> None:
         self.conn.commit()
 
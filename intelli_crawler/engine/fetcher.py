@@ -17,6 +17,12 @@ from ..infra import ProxyPool, UserAgentPool
 from .antibot import strategies
 from .antibot.chain import AntiBotContext, AntiBotChain, RequestDirective
 
+# Aliyun WAF challenge markers, matched against the undecoded response body.
+_WAF_MARKERS = (b"acw_sc__v2", b"var arg1")
+_WAF_ARG1_RE = re.compile(rb"var\\s+arg1='([0-9a-fA-F]+)'")
+# 同步客户端跨多次运行复用，保留足够的空闲连接供工作线程共享
+_SYNC_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+
 
 @dataclass(slots=True)
 class FetchRequest:
@@ -80,10 +86,12 @@ class Fetcher:
                 default_ua = next((ua for ua in ua_list if "Windows NT" in ua), ua_list[0])
         except Exception:
             default_ua = None
+        self._default_headers = {"User-Agent": default_ua} if default_ua else None
         self._client = httpx.Client(
             follow_redirects=True,
             timeout=15,
-            headers={"User-Agent": default_ua} if default_ua else None,
+            headers=self._default_headers,
+            limits=_SYNC_LIMITS,
         )
         self._browser_sessions: dict[int, _PlaywrightSession] = {}
         self._browser_lock = Lock()
@@ -102,16 +110,7 @@ class Fetcher:
         context, chain = self._build_chain(source)
         last_error: Exception | None = None
         while True:
-            directive = chain.prepare(context)
-            req_headers = dict(request.headers or {})
-            if directive.headers:
-                req_headers.update(directive.headers)
-            if request.force_browser:
-                directive.use_browser = True
-            timeout = request.timeout or directive.timeout or 20
-            proxies = (
-                {"http": directive.proxy, "https": directive.proxy} if directive.proxy else None
-            )
+            directive, req_headers, timeout = self._prepare_attempt(chain, context, request)
 
             if directive.delay:
                 time.sleep(min(directive.delay, 5.0))
@@ -120,19 +119,13 @@ class Fetcher:
                 if directive.use_browser:
                     response = self._fetch_via_browser(request, req_headers, timeout, source)
                 else:
-                    request_kwargs: dict[str, Any] = {
-                        "method": request.method,
-                        "url": request.url,
-                        "params": request.params,
-                        "data": request.data,
-                        "headers": req_headers,
-                        "cookies": request.cookies,
-                        "timeout": timeout,
-                    }
-                    if proxies:
-                        request_kwargs["proxies"] = proxies
-                    response = self._client.request(**request_kwargs)
-                    adjusted = self._maybe_solve_aliyun_waf(response, request, req_headers)
+                    response = self._client.request(
+                        **self._request_kwargs(request, req_headers, timeout, directive)
+                    )
+                    # 只读取一次原始字节：WAF 检测在字节层面完成，文本仅在构造结果时解码
+                    adjusted = self._maybe_solve_aliyun_waf(
+                        response, request, req_headers, raw=response.content
+                    )
                     if adjusted is not None:
                         response = adjusted
                 if self._is_failure(response):
@@ -140,13 +133,7 @@ class Fetcher:
                     last_error = RuntimeError(f"Unexpected status {response.status_code}")
                 else:
                     chain.notify_success(context, response)
-                    return FetchResponse(
-                        url=str(response.url),
-                        status_code=response.status_code,
-                        text=response.text,
-                        headers=dict(response.headers),
-                        raw=response if isinstance(response, httpx.Response) else None,
-                    )
+                    return self._to_fetch_response(response)
             except Exception as exc:  # noqa: BLE001
                 self.logger.warning(
                     "fetch_error",
@@ -164,6 +151,49 @@ class Fetcher:
             f"Fetch failed after {context.max_attempts} attempts: {request.url}"
         ) from last_error
 
+    @staticmethod
+    def _prepare_attempt(
+        chain: AntiBotChain, context: AntiBotContext, request: FetchRequest
+    ) -> tuple[RequestDirective, dict[str, str], float]:
+        directive = chain.prepare(context)
+        req_headers = dict(request.headers or {})
+        if directive.headers:
+            req_headers.update(directive.headers)
+        if request.force_browser:
+            directive.use_browser = True
+        timeout = request.timeout or directive.timeout or 20
+        return directive, req_headers, timeout
+
+    @staticmethod
+    def _request_kwargs(
+        request: FetchRequest,
+        headers: dict[str, str],
+        timeout: float,
+        directive: RequestDirective,
+    ) -> dict[str, Any]:
+        request_kwargs: dict[str, Any] = {
+            "method": request.method,
+            "url": request.url,
+            "params": request.params,
+            "data": request.data,
+            "headers": headers,
+            "cookies": request.cookies,
+            "timeout": timeout,
+        }
+        if directive.proxy:
+            request_kwargs["proxies"] = {"http": directive.proxy, "https": directive.proxy}
+        return request_kwargs
+
+    @staticmethod
+    def _to_fetch_response(response: Any) -> FetchResponse:
+        return FetchResponse(
+            url=str(response.url),
+            status_code=response.status_code,
+            text=response.text,
+            headers=dict(response.headers),
+            raw=response if isinstance(response, httpx.Response) else None,
+        )
+
     # ------------------------------------------------------------------
     def _build_chain(self, source: SourceConfig) -> tuple[AntiBotContext, AntiBotChain]:
         return strategies.build_chain(source, self.global_config, self.proxy_pool, self.ua_pool)
@@ -202,24 +232,44 @@ class Fetcher:
             return session
 
     def _maybe_solve_aliyun_waf(
-        self, response: Any, request: FetchRequest, headers: dict[str, str]
+        self,
+        response: Any,
+        request: FetchRequest,
+        headers: dict[str, str],
+        raw: bytes | None = None,
     ) -> httpx.Response | None:
+        waf_cookie = self._aliyun_waf_cookie(response, request, raw)
+        if waf_cookie is None:
+            return None
+        cookie_value, domain = waf_cookie
+        self._client.cookies.set("acw_sc__v2", cookie_value, domain=domain, path="/")
+        retry_response = self._client.request(**self._waf_retry_kwargs(request, headers))
+        return retry_response
+
+    @staticmethod
+    def _aliyun_waf_cookie(
+        response: Any, request: FetchRequest, raw: bytes | None = None
+    ) -> tuple[str, str] | None:
+        """Return ``(acw_sc__v2 cookie, domain)`` when the response is an Aliyun WAF challenge."""
+
         if not isinstance(response, httpx.Response):
             return None
-        text = response.text
-        if "acw_sc__v2" not in text and "var arg1" not in text:
+        if raw is None:
+            raw = response.content
+        if not any(marker in raw for marker in _WAF_MARKERS):
             return None
-        match = re.search(r"var\\s+arg1='([0-9a-fA-F]+)'", text)
+        match = _WAF_ARG1_RE.search(raw)
         if not match:
             return None
-        arg1 = match.group(1)
+        arg1 = match.group(1).decode("ascii")
         if len(arg1) < 60:
             return None
-        cookie_value = arg1[10:60]
         url = urlparse(request.url)
-        domain = url.hostname or ""
-        self._client.cookies.set("acw_sc__v2", cookie_value, domain=domain, path="/")
-        request_kwargs: dict[str, Any] = {
+        return arg1[10:60], url.hostname or ""
+
+    @staticmethod
+    def _waf_retry_kwargs(request: FetchRequest, headers: dict[str, str]) -> dict[str, Any]:
+        return {
             "method": request.method,
             "url": request.url,
             "params": request.params,
@@ -229,8 +279,6 @@ class Fetcher:
             "timeout": request.timeout or 20,
             "follow_redirects": True,
         }
-        retry_response = self._client.request(**request_kwargs)
-        return retry_response
 
     @staticmethod
     def _is_failure(response: Any) -> bool:
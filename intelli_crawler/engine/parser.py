@@ -3,16 +3,271 @@
 from __future__ import annotations
 
 import json
+import re
+import sys
+import threading
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Iterable
-from urllib.parse import urljoin
+from urllib.parse import SplitResult, urljoin, urlsplit
 
 from html import unescape
 
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
 
 from ..config import SourceConfig
 
+try:  # optional accelerator for multi-keyword filtering
+    import ahocorasick
+except ImportError:  # pragma: no cover - import guard
+    ahocorasick = None
+
+try:  # optional accelerated JSON decoder
+    import orjson
+except ImportError:  # pragma: no cover - import guard
+    orjson = None
+
+# 字段 → 预拆分的 (css, mode) 选择器序列
+CompiledPattern = tuple[tuple[str, tuple[tuple[str, str], ...]], ...]
+
+# 详情页字段为空时的 meta 回退选择器
+_META_TITLE_SELECTORS: tuple[tuple[str, str], ...] = (
+    ('meta[property="og:title"]', "attr:content"),
+    ('meta[name="title"]', "attr:content"),
+    ("title", "text"),
+)
+_META_CONTENT_SELECTORS: tuple[tuple[str, str], ...] = (
+    ('meta[property="og:description"]', "attr:content"),
+    ('meta[name="description"]', "attr:content"),
+)
+_META_FALLBACKS: dict[str, tuple[tuple[str, str], ...]] = {
+    "title": _META_TITLE_SELECTORS,
+    "content": _META_CONTENT_SELECTORS,
+}
+
+# Odaily 入口页内嵌的 initData JSON 起点
+_ODAILY_MARKER_RE = re.compile(r'initData":\s*(\{)')
+_JSON_DECODER = json.JSONDecoder()
+# 短快讯摘要直接用正则去标签，省去逐条构建 DOM
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_SHORT_DESCRIPTION_MAX = 2048
+_COMPLEX_DESCRIPTION_RE = re.compile(r"<(?:script|style|!--)|&", re.IGNORECASE)
+
+# 雪球时间线：时间戳行（HH:MM）、日期行（如 "17十月"）与需要跳过的导航标签
+_XUEQIU_TIME_RE = re.compile(r"^\d{2}:\d{2}$")
+_XUEQIU_DATE_RE = re.compile(r"^\d+[十月年]")
+_XUEQIU_NAV_LABELS = frozenset({"热门", "7x24", "视频", "基金", "资讯", "达人", "私募", "ETF"})
+
+
+@lru_cache(maxsize=4096)
+def _timestamp_ms_to_iso(timestamp_ms: int | float) -> str:
+    """毫秒时间戳 → UTC ISO 字符串（同一批快讯常共享时间戳）。"""
+
+    return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).isoformat()
+
+
+def _html_to_text(fragment: str) -> str:
+    if len(fragment) < _SHORT_DESCRIPTION_MAX and not _COMPLEX_DESCRIPTION_RE.search(fragment):
+        return _WS_RE.sub(" ", _TAG_RE.sub(" ", fragment)).strip()
+    # 含脚本/样式或仍带实体时交给 selectolax，保证文本与 DOM 解析一致
+    return HTMLParser(fragment).text(separator=" ", strip=True)
+
+
+def _join_entry_url(base_url: str, base: SplitResult, href: str) -> str:
+    # 常见的绝对地址 / 站内绝对路径直接拼接；含点段或空查询/片段时交给 urljoin 规范化
+    if "/." not in href and not href.endswith(("?", "#")):
+        if href.startswith(("http://", "https://")):
+            if href.startswith(base.scheme + ":"):
+                return href
+        elif href.startswith("/") and not href.startswith("//"):
+            return f"{base.scheme}://{base.netloc}{href}"
+    return urljoin(base_url, href)
+
+
+# 每个线程保留最近解析的文档：同一页面先 parse_entries 再做入口记录抽取时复用 DOM
+_THREAD_STATE = threading.local()
+
+
+def _document(html: str) -> HTMLParser:
+    """Return a parsed tree for ``html``, reusing this thread's last tree for the same string.
+
+    selectolax has no API to reset a parser with new input, so reuse is limited to
+    repeated parses of the identical ``str`` object; callers must not mutate the tree.
+    """
+
+    cached = getattr(_THREAD_STATE, "document", None)
+    if cached is not None and cached[0] is html:
+        return cached[1]
+    parser = HTMLParser(html)
+    _THREAD_STATE.document = (html, parser)
+    return parser
+
+
+# 关键词不多于该数量时直接逐个子串查找，无需构建自动机
+_KEYWORD_SCAN_MAX = 3
+
+# 简单选择器：可选标签 + 任意 .class/#id + 至多一个 [attr] / [attr=value]
+_SIMPLE_SELECTOR_RE = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*)?(?P<quals>(?:[.#][\w-]+)*)"
+    r"(?:\[(?P<attr>[\w-]+)(?:=(?P<quote>[\"']?)(?P<value>[^\"'\]]*)(?P=quote))?\])?$"
+)
+# 简单选择器少于该数量时，逐个 css_first（C 层遍历）比一次 Python 层遍历更便宜
+_FUSED_WALK_MIN_SELECTORS = 3
+
+
+@lru_cache(maxsize=1024)
+def _split_selector(selector: str) -> tuple[str, str]:
+    if "::" in selector:
+        css, mode = selector.split("::", 1)
+        return css.strip(), mode.strip().lower()
+    return selector.strip(), "text"
+
+
+def _compile_pattern(pattern: dict[str, str | list[str]]) -> CompiledPattern:
+    # 支持单选择器或多选择器列表；按内容归一为可哈希的键，重载或复制出的配置共用编译结果
+    key = tuple(
+        (field, tuple(selector_config) if isinstance(selector_config, list) else (selector_config,))
+        for field, selector_config in pattern.items()
+    )
+    return _compile_pattern_key(key)
+
+
+@lru_cache(maxsize=512)
+def _compile_pattern_key(key: tuple[tuple[str, tuple[str, ...]], ...]) -> CompiledPattern:
+    compiled: list[tuple[str, tuple[tuple[str, str], ...]]] = []
+    for field, selectors in key:
+        split = tuple(
+            (css, mode) for css, mode in map(_split_selector, selectors) if css
+        )
+        # 字段名驻留，写入 record.data 时键比较可走指针相等
+        compiled.append((sys.intern(field), split))
+    return tuple(compiled)
+
+
+def _compiled_detail_pattern(source: SourceConfig) -> CompiledPattern:
+    pattern = source.detail_pattern
+    cached = source._compiled_detail
+    if cached is not None and cached[0] is pattern:
+        return cached[1]
+    compiled = _compile_pattern(pattern or {})
+    source._compiled_detail = (pattern, compiled)
+    return compiled
+
+
+@dataclass(frozen=True, slots=True)
+class _SimpleSelector:
+    """Selector that can be matched against a single node without CSS engine help."""
+
+    tag: str | None
+    classes: tuple[str, ...]
+    node_id: str | None
+    attr: str | None
+    value: str | None
+
+    def matches(self, node: Any) -> bool:
+        if not (self.classes or self.node_id or self.attr):
+            return True
+        attributes = node.attributes
+        if self.classes:
+            node_classes = (attributes.get("class") or "").split()
+            if not all(cls in node_classes for cls in self.classes):
+                return False
+        if self.node_id is not None and attributes.get("id") != self.node_id:
+            return False
+        if self.attr is not None:
+            if self.attr not in attributes:
+                return False
+            if self.value is not None and attributes.get(self.attr) != self.value:
+                return False
+        return True
+
+
+@lru_cache(maxsize=1024)
+def _compile_simple_selector(css: str) -> _SimpleSelector | None:
+    match = _SIMPLE_SELECTOR_RE.match(css)
+    if not match or not css:
+        return None
+    quals = re.findall(r"([.#])([\w-]+)", match.group("quals") or "")
+    ids = [name for prefix, name in quals if prefix == "#"]
+    if len(ids) > 1:
+        return None
+    tag = match.group("tag")
+    return _SimpleSelector(
+        tag=tag.lower() if tag else None,
+        classes=tuple(name for prefix, name in quals if prefix == "."),
+        node_id=ids[0] if ids else None,
+        attr=match.group("attr"),
+        value=match.group("value"),
+    )
+
+
+@lru_cache(maxsize=256)
+def _normalise_keywords(keywords: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(sorted({keyword.casefold() for keyword in keywords}))
+
+
+@lru_cache(maxsize=128)
+def _keyword_automaton(keywords: tuple[str, ...]) -> Any:
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=128)
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    # 未安装 pyahocorasick 时的回退：一次 C 层扫描代替 K 次子串查找
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+def _first_nodes(parser: HTMLParser, selectors: Iterable[str]) -> dict[str, Any]:
+    """Return the first node matching each selector, walking the DOM at most once.
+
+    Simple selectors are matched together during a single pre-order traversal that
+    stops as soon as every selector has a hit; anything more complex falls back to
+    ``css_first``.
+    """
+
+    found: dict[str, Any] = {}
+    simple: dict[str, _SimpleSelector] = {}
+    for css in selectors:
+        if css in found or css in simple:
+            continue
+        compiled = _compile_simple_selector(css)
+        if compiled is None:
+            found[css] = parser.css_first(css)
+        else:
+            simple[css] = compiled
+
+    root = parser.root
+    if len(simple) < _FUSED_WALK_MIN_SELECTORS or root is None:
+        for css in simple:
+            found[css] = parser.css_first(css)
+        return found
+
+    by_tag: dict[str | None, dict[str, _SimpleSelector]] = {}
+    for css, compiled in simple.items():
+        by_tag.setdefault(compiled.tag, {})[css] = compiled
+    any_tag = by_tag.get(None, {})
+    pending = len(simple)
+    for node in root.traverse(include_text=False):
+        for group in (by_tag.get(node.tag), any_tag):
+            if not group:
+                continue
+            for css, compiled in list(group.items()):
+                if compiled.matches(node):
+                    found[css] = node
+                    del group[css]
+                    pending -= 1
+        if not pending:
+            break
+    for css in simple:
+        found.setdefault(css, None)
+    return found
+
 
 @dataclass
 class ParsedRecord:
@@ -26,9 +281,10 @@ class Parser:
     """Parse listing and detail responses according to source templates."""
 
     def parse_entries(self, source: SourceConfig, html: str, base_url: str) -> list[str]:
-        parser = HTMLParser(html)
-        entries: list[str] = []
-        seen: set[str] = set()
+        parser = _document(html)
+        base = urlsplit(base_url)
+        # dict 保持插入顺序，同时承担去重
+        entries: dict[str, None] = {}
         for node in parser.css(source.entry_pattern):
             href = node.attributes.get("href")
             if not href:
@@ -36,11 +292,8 @@ class Parser:
             href = href.strip()
             if not href or href.startswith(("javascript:", "#")):
                 continue
-            full_url = urljoin(base_url, href)
-            if full_url not in seen:
-                seen.add(full_url)
-                entries.append(full_url)
-        return entries
+            entries.setdefault(_join_entry_url(base_url, base, href))
+        return list(entries)
 
     def parse_detail(self, source: SourceConfig, html: str, url: str) -> ParsedRecord:
         """
@@ -60,85 +313,66 @@ class Parser:
             "site_type": source.site_type.value,
         }
         if source.detail_pattern:
-            parser = HTMLParser(html)
-            for field, selector_config in source.detail_pattern.items():
-                # 支持单选择器或多选择器列表
-                selectors = (
-                    selector_config if isinstance(selector_config, list) else [selector_config]
-                )
-
+            parser = _document(html)
+            compiled = _compiled_detail_pattern(source)
+            first_nodes = _first_nodes(
+                parser, (css for _, selectors in compiled for css, _ in selectors)
+            )
+            for field, selectors in compiled:
                 field_value = None
-                for selector in selectors:
-                    css_selector, mode = self._split_selector(selector)
-                    if not css_selector:
-                        continue
-
-                    node = parser.css_first(css_selector)
+                for css_selector, mode in selectors:
+                    node = first_nodes[css_selector]
                     if node:
-                        if mode == "html":
-                            field_value = node.html
-                        elif mode.startswith("attr:"):
-                            attr = mode.split(":", 1)[1]
-                            field_value = node.attributes.get(attr)
-                        else:
-                            field_value = node.text(separator=" ", strip=True)
-
+                        field_value = self._node_value(node, mode)
                         # 如果获取到有效内容，跳出回退循环
                         if field_value and field_value.strip():
                             break
 
                 # 如果所有选择器都没有获取到内容，尝试从meta标签获取
                 if not field_value or not field_value.strip():
-                    if field == "title":
-                        # 尝试从meta标签获取标题
-                        meta_selectors = [
-                            'meta[property="og:title"]',
-                            'meta[name="title"]',
-                            "title",
-                        ]
-                        for meta_selector in meta_selectors:
-                            node = parser.css_first(meta_selector)
-                            if node:
-                                if meta_selector == "title":
-                                    field_value = node.text(separator=" ", strip=True)
-                                else:
-                                    field_value = node.attributes.get("content")
-                                if field_value and field_value.strip():
-                                    break
-                    elif field == "content":
-                        # 尝试从meta描述获取内容
-                        meta_selectors = [
-                            'meta[property="og:description"]',
-                            'meta[name="description"]',
-                        ]
-                        for meta_selector in meta_selectors:
-                            node = parser.css_first(meta_selector)
-                            if node:
-                                field_value = node.attributes.get("content")
-                                if field_value and field_value.strip():
-                                    break
+                    for meta_selector, mode in _META_FALLBACKS.get(field, ()):
+                        node = parser.css_first(meta_selector)
+                        if node:
+                            field_value = self._node_value(node, mode)
+                            if field_value and field_value.strip():
+                                break
 
                 data[field] = field_value if field_value and field_value.strip() else None
 
-        if "raw_html" not in data:
+        if source.keep_raw_html and "raw_html" not in data:
             data["raw_html"] = html
         return ParsedRecord(url=url, data=data)
 
     def parse_json(self, payload: str) -> Any:
+        if orjson is not None:
+            return orjson.loads(payload.encode())
         return json.loads(payload)
 
     def filter_by_keywords(self, record: ParsedRecord, keywords: Iterable[str]) -> bool:
-        if not keywords:
+        needles = _normalise_keywords(tuple(keywords))
+        if not needles or "" in needles:
+            return True
+        # 字段之间使用不可见分隔符，避免关键词跨字段误匹配
+        haystack = "\x01".join(str(value) for value in record.data.values() if value).casefold()
+        if len(needles) <= _KEYWORD_SCAN_MAX:
+            return any(needle in haystack for needle in needles)
+        if ahocorasick is None:
+            return _keyword_pattern(needles).search(haystack) is not None
+        for _ in _keyword_automaton(needles).iter(haystack):
             return True
-        haystack = " ".join(str(value) for value in record.data.values() if value)
-        return any(keyword.lower() in haystack.lower() for keyword in keywords)
+        return False
 
     @staticmethod
     def _split_selector(selector: str) -> tuple[str, str]:
-        if "::" in selector:
-            css, mode = selector.split("::", 1)
-            return css.strip(), mode.strip().lower()
-        return selector.strip(), "text"
+        return _split_selector(selector)
+
+    @staticmethod
+    def _node_value(node: Any, mode: str) -> str | None:
+        if mode == "html":
+            return node.html
+        if mode.startswith("attr:"):
+            return node.attributes.get(mode[5:])
+        return node.text(separator=" ", strip=True)
 
     def extract_list_records(
         self, source: SourceConfig, html: str, base_url: str
@@ -151,29 +385,17 @@ class Parser:
 
         返回：记录URL → 字段字典。
         """
-        parser = HTMLParser(html)
+        parser = _document(html)
         records: dict[str, dict[str, Any]] = {}
         for item in parser.css(source.entry_pattern):
             record: dict[str, Any] = {}
             # 按字段配置提取内容（相对当前项）
-            for field, selector_config in (source.detail_pattern or {}).items():
-                selectors = (
-                    selector_config if isinstance(selector_config, list) else [selector_config]
-                )
+            for field, selectors in _compiled_detail_pattern(source):
                 field_value = None
-                for selector in selectors:
-                    css_selector, mode = self._split_selector(selector)
-                    if not css_selector:
-                        continue
+                for css_selector, mode in selectors:
                     node = item.css_first(css_selector)
                     if node:
-                        if mode == "html":
-                            field_value = node.html
-                        elif mode.startswith("attr:"):
-                            attr = mode.split(":", 1)[1]
-                            field_value = node.attributes.get(attr)
-                        else:
-                            field_value = node.text(separator=" ", strip=True)
+                        field_value = self._node_value(node, mode)
                         if field_value and str(field_value).strip():
                             break
                 record[field] = field_value if field_value and str(field_value).strip() else None
@@ -202,24 +424,26 @@ class Parser:
         return records
 
     def extract_foresight_records(self, html: str, base_url: str) -> dict[str, dict[str, Any]]:
-        parser = HTMLParser(html)
+        parser = _document(html)
         records: dict[str, dict[str, Any]] = {}
         wrappers = parser.css("div.el-timeline-item__wrapper")
         if not wrappers:
             wrappers = parser.css("div.list_body")
         for item in wrappers:
+            # 每个选择器都要遍历一次卡片子树：先查决定去留的标题/正文，缺失即跳过，时间最后再查
             title_node = item.css_first("a.news_body_title")
+            if not title_node:
+                continue
             content_node = item.css_first("div.news_body_content span")
-            time_node = item.css_first("div.el-timeline-item__timestamp")
             if not content_node:
                 content_node = item.css_first("div.detail-body")
-            link_node = title_node
-            if not title_node or not content_node or not link_node:
-                continue
-            href = link_node.attributes.get("href") or ""
+                if not content_node:
+                    continue
+            href = title_node.attributes.get("href") or ""
             full_url = urljoin(base_url, href)
             if not full_url:
                 continue
+            time_node = item.css_first("div.el-timeline-item__timestamp")
             if time_node is None:
                 time_node = item.css_first("span.topic-time")
             title_text = title_node.text(strip=True)
@@ -237,30 +461,15 @@ class Parser:
         return records
 
     def extract_odaily_records(self, html: str, base_url: str) -> dict[str, dict[str, Any]]:
-        marker = 'initData":'
-        idx = html.find(marker)
-        if idx == -1:
-            return {}
-        start = html.find("{", idx)
-        if start == -1:
-            return {}
-        brace = 0
-        end = None
-        for pos in range(start, len(html)):
-            ch = html[pos]
-            if ch == "{":
-                brace += 1
-            elif ch == "}":
-                brace -= 1
-                if brace == 0:
-                    end = pos + 1
-                    break
-        if end is None:
+        match = _ODAILY_MARKER_RE.search(html)
+        if match is None:
             return {}
         try:
-            payload = json.loads(html[start:end])
+            payload, _end = _JSON_DECODER.raw_decode(html, match.start(1))
         except json.JSONDecodeError:
             return {}
+        if not isinstance(payload, dict):
+            return {}
         page_result = payload.get("pageResult", {})
         items = page_result.get("list") or []
         records: dict[str, dict[str, Any]] = {}
@@ -270,12 +479,11 @@ class Parser:
             record_url = urljoin(base_url, f"/zh-CN/newsflash/{item.get('id')}")
             description = item.get("description") or ""
             description_html = unescape(description)
-            text_content = HTMLParser(description_html).text(separator=" ", strip=True)
+            text_content = _html_to_text(description_html)
             publish_ts = item.get("publishTimestamp")
-            if isinstance(publish_ts, (int, float)):
-                published = datetime.fromtimestamp(publish_ts / 1000, tz=timezone.utc).isoformat()
-            else:
-                published = None
+            published = (
+                _timestamp_ms_to_iso(publish_ts) if isinstance(publish_ts, (int, float)) else None
+            )
             records[record_url] = {
                 "title": item.get("title") or "",
                 "content": text_content,
@@ -289,7 +497,7 @@ class Parser:
         专门处理雪球网站的时间线内容提取
         从整个时间线文本中按行解析新闻条目，支持动态加载内容
         """
-        parser = HTMLParser(html)
+        parser = _document(html)
         timeline_element = parser.css_first(".style_home__timeline_1Tz")
 
         if not timeline_element:
@@ -304,26 +512,21 @@ class Parser:
         news_items = []
         current_item = []
 
-        # 时间戳模式：匹配 HH:MM 格式
-        import re
-
-        time_pattern = re.compile(r"^\d{2}:\d{2}$")
-
         for line in lines:
             line = line.strip()
             if not line:
                 continue
 
             # 跳过导航标签和无关内容
-            if line in ["热门", "7x24", "视频", "基金", "资讯", "达人", "私募", "ETF"]:
+            if line in _XUEQIU_NAV_LABELS:
                 continue
 
             # 跳过日期行（如 "17十月"）
-            if re.match(r"^\d+[十月年]", line):
+            if _XUEQIU_DATE_RE.match(line):
                 continue
 
             # 检查是否是时间戳行（HH:MM格式）
-            if time_pattern.match(line):
+            if _XUEQIU_TIME_RE.match(line):
                 # 如果有当前项目，保存它
                 if current_item:
                     content = " ".join(current_item).strip()
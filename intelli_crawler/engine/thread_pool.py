@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
-from threading import Lock
-from typing import Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Dict, TypeVar
+
+T = TypeVar("T")
 
 
 class ThreadPoolManager:
@@ -12,10 +14,41 @@ class ThreadPoolManager:
 
     def __init__(self, default_workers: int = 8) -> None:
         self.default_workers = default_workers
-        self._default_executor = ThreadPoolExecutor(max_workers=default_workers, thread_name_prefix="crawler")
+        # 两个共享池都在首次使用时才创建；ThreadPoolExecutor 本身也只在提交任务且没有空闲线程时
+        # 才新建线程，因此空闲的管理器不占用任何 OS 线程
+        self._default: ThreadPoolExecutor | None = None
+        # 详情任务共用一个工作池，按来源用信号量限流，线程数不随来源数量增长；
+        # 与默认池分开，避免在默认池中运行的 run_source 等待自身池而死锁
+        self._worker: ThreadPoolExecutor | None = None
         self._executors: Dict[str, ThreadPoolExecutor] = {}
+        # 以 (来源, 并发上限) 为键，同一来源换用不同上限时不会沿用首次的信号量
+        self._semaphores: Dict[tuple[str, int], BoundedSemaphore] = {}
         self._lock = Lock()
 
+    @property
+    def _default_executor(self) -> ThreadPoolExecutor:
+        executor = self._default
+        if executor is None:
+            with self._lock:
+                if self._default is None:
+                    self._default = ThreadPoolExecutor(
+                        max_workers=self.default_workers, thread_name_prefix="crawler"
+                    )
+                executor = self._default
+        return executor
+
+    @property
+    def _worker_executor(self) -> ThreadPoolExecutor:
+        executor = self._worker
+        if executor is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = ThreadPoolExecutor(
+                        max_workers=self.default_workers, thread_name_prefix="crawler-worker"
+                    )
+                executor = self._worker
+        return executor
+
     def get(self, source_name: str | None = None, max_workers: int | None = None) -> ThreadPoolExecutor:
         if source_name is None:
             return self._default_executor
@@ -27,12 +60,54 @@ class ThreadPoolManager:
                 )
             return self._executors[source_name]
 
-    def shutdown(self) -> None:
-        self._default_executor.shutdown(wait=False)
+    def submit(
+        self,
+        source_name: str,
+        fn: Callable[..., T],
+        *args: Any,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> Future[T]:
+        """Submit ``fn`` to the shared worker pool, at most ``max_workers`` per source at once.
+
+        Blocks the caller while the source already has ``max_workers`` tasks in flight.
+        """
+
+        semaphore = self._semaphore(source_name, max_workers)
+        semaphore.acquire()
+        try:
+            future = self._worker_executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            semaphore.release()
+            raise
+        future.add_done_callback(lambda _future: semaphore.release())
+        return future
+
+    def _semaphore(self, source_name: str, max_workers: int | None) -> BoundedSemaphore:
+        key = (source_name, max_workers or self.default_workers)
+        semaphore = self._semaphores.get(key)
+        if semaphore is not None:
+            return semaphore
+        with self._lock:
+            if key not in self._semaphores:
+                self._semaphores[key] = BoundedSemaphore(key[1])
+            return self._semaphores[key]
+
+    def shutdown(self, wait: bool = False, cancel_futures: bool = True) -> None:
+        """Stop every pool created so far; queued tasks are cancelled unless asked otherwise."""
+
         with self._lock:
-            for executor in self._executors.values():
-                executor.shutdown(wait=False)
+            executors = [
+                executor
+                for executor in (self._default, self._worker, *self._executors.values())
+                if executor is not None
+            ]
+            self._default = None
+            self._worker = None
             self._executors.clear()
+            self._semaphores.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
 
 
 __all__ = ["ThreadPoolManager"]
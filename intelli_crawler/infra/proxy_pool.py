@@ -3,47 +3,62 @@
 from __future__ import annotations
 
 import random
+from itertools import cycle
 from pathlib import Path
 from threading import Lock
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 
 class ProxyPool:
     """Circular proxy provider with optional backing file."""
 
-    def __init__(self, proxies: Iterable[str] | None = None, file_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        proxies: Iterable[str] | None = None,
+        file_path: Path | None = None,
+        *,
+        rng: random.Random | None = None,
+    ) -> None:
         self._lock = Lock()
-        self._index = 0
-        self._proxies: List[str] = []
+        # 每个池独立的随机数生成器，不与全局 random 状态共享；可注入以便测试确定性
+        self._rng = rng or random.Random()
+        self._cycle: Optional[Iterator[str]] = None
+        initial: List[str] = []
         if proxies:
-            self._proxies.extend(p.strip() for p in proxies if p.strip())
+            initial.extend(p.strip() for p in proxies if p.strip())
         if file_path and file_path.exists():
             lines = file_path.read_text(encoding="utf-8").splitlines()
-            self._proxies.extend(line.strip() for line in lines if line.strip())
-        random.shuffle(self._proxies)
+            initial.extend(line.strip() for line in lines if line.strip())
+        self._rng.shuffle(initial)
+        self._publish(tuple(initial))
 
     @property
     def empty(self) -> bool:
         return not self._proxies
 
     def get_proxy(self) -> Optional[str]:
-        with self._lock:
-            if not self._proxies:
-                return None
-            proxy = self._proxies[self._index % len(self._proxies)]
-            self._index += 1
-            return proxy
+        # 热路径不加锁：itertools.cycle 的 next 在 CPython 中由 C 实现，持有 GIL 原子执行
+        proxies = self._cycle
+        if proxies is None:
+            return None
+        return next(proxies)
 
     def add_proxy(self, proxy: str) -> None:
         if not proxy:
             return
         with self._lock:
-            self._proxies.append(proxy)
+            self._publish(self._proxies + (proxy,))
 
     def refresh(self, proxies: Iterable[str]) -> None:
+        # 新快照在锁外构建，读者始终看到完整的旧快照或新快照
+        fresh = [p.strip() for p in proxies if p.strip()]
+        self._rng.shuffle(fresh)
         with self._lock:
-            self._proxies = [p.strip() for p in proxies if p.strip()]
-            random.shuffle(self._proxies)
+            self._publish(tuple(fresh))
+
+    def _publish(self, snapshot: Tuple[str, ...]) -> None:
+        self._proxies = snapshot
+        self._cycle = cycle(snapshot) if snapshot else None
 
 
 __all__ = ["ProxyPool"]
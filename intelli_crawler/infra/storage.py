@@ -2,28 +2,138 @@
 
 from __future__ import annotations
 
+import itertools
+import os
 import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
 from threading import Lock
-from typing import Dict
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+# WAL 模式下写入不阻塞读取，synchronous=NORMAL 避免每次提交都 fsync
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA mmap_size=268435456;"
+    "PRAGMA cache_size=-65536;"
+)
+
+# 测试或一次性导入无需持久性：日志留在内存、不 fsync
+_FAST_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY;"
+    "PRAGMA synchronous=OFF;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-65536;"
+)
+
+_MEMORY_PATH = ":memory:"
+# 每个管理器一个命名的共享缓存内存库，所有线程的连接都指向同一个库
+_MEMORY_URI = "file:intelli-crawler-{}?mode=memory&cache=shared"
+_MEMORY_IDS = itertools.count()
+
+# (所属线程的弱引用, 连接)
+_OwnedConnection = Tuple["weakref.ref[threading.Thread]", sqlite3.Connection]
+
+_INSERT_HISTORY_SQL = (
+    "INSERT OR REPLACE INTO crawl_history(url, content_hash, timestamp, source_name) "
+    "VALUES (?, ?, datetime('now'), ?)"
+)
 
 
 class SQLiteManager:
-    """Manage SQLite connections with basic schema guarantees."""
+    """Manage SQLite connections with basic schema guarantees.
+
+    Connections are never shared across processes: a forked child drops the handles it
+    inherited and reopens its own on the next :meth:`connect`.
+    """
+
+    def __init__(self, fast_mode: bool = False) -> None:
+        self.fast_mode = fast_mode
+        # 每个线程持有自己的连接，避免所有线程在同一个 sqlite3 连接互斥量上排队
+        self._local = threading.local()
+        # 连接与其所属线程（弱引用）一起登记，线程退出后的连接在下次打开新连接时关闭
+        self._connections: Dict[Path, List[_OwnedConnection]] = {}
+        self._generations: Dict[Path, int] = {}
+        self._initialised: Set[Path] = set()
+        self._lock = Lock()
+        self._init_memory_database()
+        _MANAGERS.add(self)
 
-    def __init__(self) -> None:
-        self._connections: Dict[Path, sqlite3.Connection] = {}
+    def _init_memory_database(self) -> None:
+        self._memory_uri = _MEMORY_URI.format(next(_MEMORY_IDS))
+        # 共享内存库在最后一个连接关闭时销毁；锚点连接不随线程退出而关闭，直到 reset/close_all
+        self._memory_anchor: sqlite3.Connection | None = None
+
+    def _after_fork(self) -> None:
+        # 子进程不能继续使用父进程打开的 sqlite3 连接；只丢弃引用，不在子进程中 close
+        self._local = threading.local()
+        self._connections = {}
+        self._generations = {}
+        self._initialised = set()
         self._lock = Lock()
+        self._init_memory_database()
+
+    def connect(self, path: Path, *, fast_mode: bool | None = None) -> sqlite3.Connection:
+        """Return this thread's connection to ``path``, opening it on first use.
 
-    def connect(self, path: Path) -> sqlite3.Connection:
-        path.parent.mkdir(parents=True, exist_ok=True)
+        ``Path(":memory:")`` is one in-memory database per manager, shared by every thread
+        until :meth:`reset` or :meth:`close_all`. ``fast_mode`` (defaulting to the
+        manager-wide setting) trades durability for write speed.
+        """
+
+        cache = self._thread_cache()
+        cached = cache.get(path)
+        if cached is not None and cached[0] == self._generations.get(path, 0):
+            return cached[1]
+        in_memory = str(path) == _MEMORY_PATH
+        if in_memory:
+            conn = sqlite3.connect(self._memory_uri, uri=True, check_same_thread=False)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        if fast_mode is None:
+            fast_mode = self.fast_mode
+        conn.executescript(_FAST_CONNECTION_PRAGMAS if fast_mode else _CONNECTION_PRAGMAS)
         with self._lock:
-            if path not in self._connections:
-                conn = sqlite3.connect(path, check_same_thread=False)
-                conn.row_factory = sqlite3.Row
-                self._connections[path] = conn
+            if in_memory and self._memory_anchor is None:
+                self._memory_anchor = sqlite3.connect(
+                    self._memory_uri, uri=True, check_same_thread=False
+                )
+            if path not in self._initialised:
                 self._ensure_schema(conn)
-            return self._connections[path]
+                self._initialised.add(path)
+            self._prune_dead_threads()
+            owner = weakref.ref(threading.current_thread())
+            self._connections.setdefault(path, []).append((owner, conn))
+            generation = self._generations.get(path, 0)
+        cache[path] = (generation, conn)
+        return conn
+
+    def _prune_dead_threads(self) -> None:
+        # 调用方持有 self._lock；to_thread / 线程池的工作线程会不断更替，
+        # 其 threading.local 缓存随线程消失，这里关闭残留的连接
+        for path, entries in list(self._connections.items()):
+            alive = []
+            for owner, conn in entries:
+                thread = owner()
+                if thread is not None and thread.is_alive():
+                    alive.append((owner, conn))
+                else:
+                    conn.close()
+            if alive:
+                self._connections[path] = alive
+            else:
+                del self._connections[path]
+
+    def _thread_cache(self) -> Dict[Path, Tuple[int, sqlite3.Connection]]:
+        cache = getattr(self._local, "connections", None)
+        if cache is None:
+            cache = self._local.connections = {}
+        return cache
 
     def _ensure_schema(self, conn: sqlite3.Connection) -> None:
         conn.execute(
@@ -36,21 +146,87 @@ class SQLiteManager:
             )
             """
         )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_hist_hash ON crawl_history(content_hash)"
+        )
+        conn.commit()
+
+    def insert_many(
+        self, conn: sqlite3.Connection, rows: Iterable[tuple[str, str | None, str | None]]
+    ) -> int:
+        """批量写入 (url, content_hash, source_name)，整批只提交一次。"""
+
+        with conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            cur = conn.executemany(_INSERT_HISTORY_SQL, rows)
+        return cur.rowcount
+
+    @contextmanager
+    def transaction(self, path: Path) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed statements in one ``BEGIN IMMEDIATE`` transaction.
+
+        Commits on success and rolls back if the block raises.
+        """
+
+        conn = self.connect(path)
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
         conn.commit()
 
     def reset(self, path: Path) -> None:
-        if path.exists():
-            path.unlink()
         with self._lock:
-            if path in self._connections:
-                self._connections[path].close()
-                del self._connections[path]
+            # 递增代号使各线程缓存的旧连接失效，下次 connect 时重新打开
+            self._generations[path] = self._generations.get(path, 0) + 1
+            self._initialised.discard(path)
+            for _owner, conn in self._connections.pop(path, []):
+                conn.close()
+            if str(path) == _MEMORY_PATH:
+                # 关闭锚点后内存库随最后一个连接一起销毁，下次 connect 得到空库
+                self._close_memory_anchor()
+                return
+        # WAL 模式会在旁边生成 -wal / -shm 文件，一并删除
+        for candidate in (
+            path,
+            path.with_name(path.name + "-wal"),
+            path.with_name(path.name + "-shm"),
+        ):
+            if candidate.exists():
+                candidate.unlink()
 
     def close_all(self) -> None:
         with self._lock:
-            for conn in self._connections.values():
-                conn.close()
+            for path, entries in self._connections.items():
+                self._generations[path] = self._generations.get(path, 0) + 1
+                for _owner, conn in entries:
+                    conn.close()
             self._connections.clear()
+            self._initialised.clear()
+            self._close_memory_anchor()
+
+    def _close_memory_anchor(self) -> None:
+        # 调用方持有 self._lock
+        if self._memory_anchor is not None:
+            self._memory_anchor.close()
+            self._memory_anchor = None
+
+
+# 存活的管理器实例，fork 后在子进程中统一失效其连接缓存
+_MANAGERS: "weakref.WeakSet[SQLiteManager]" = weakref.WeakSet()
+
+
+def _reset_managers_after_fork() -> None:
+    for manager in list(_MANAGERS):
+        manager._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_managers_after_fork)
 
 
 __all__ = ["SQLiteManager"]
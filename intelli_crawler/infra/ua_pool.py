@@ -5,30 +5,41 @@ from __future__ import annotations
 import random
 from pathlib import Path
 from threading import Lock
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 
 class UserAgentPool:
     """Return random user agents from configured pool."""
 
-    def __init__(self, user_agents: Iterable[str] | None = None, file_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        user_agents: Iterable[str] | None = None,
+        file_path: Path | None = None,
+        *,
+        rng: random.Random | None = None,
+    ) -> None:
         self._lock = Lock()
-        self._uas: List[str] = []
+        # 每个池独立的随机数生成器，不与全局 random 状态共享；可注入以便测试确定性
+        self._rng = rng or random.Random()
+        initial: List[str] = []
         if user_agents:
-            self._uas.extend(ua.strip() for ua in user_agents if ua.strip())
+            initial.extend(ua.strip() for ua in user_agents if ua.strip())
         if file_path and file_path.exists():
             lines = file_path.read_text(encoding="utf-8").splitlines()
-            self._uas.extend(line.strip() for line in lines if line.strip())
+            initial.extend(line.strip() for line in lines if line.strip())
+        self._uas: Tuple[str, ...] = tuple(initial)
 
     def get(self) -> Optional[str]:
-        with self._lock:
-            if not self._uas:
-                return None
-            return random.choice(self._uas)
+        # 读取不可变快照，无需加锁；refresh 只做一次引用替换
+        uas = self._uas
+        if not uas:
+            return None
+        return self._rng.choice(uas)
 
     def refresh(self, user_agents: Iterable[str]) -> None:
+        fresh = tuple(ua.strip() for ua in user_agents if ua.strip())
         with self._lock:
-            self._uas = [ua.strip() for ua in user_agents if ua.strip()]
+            self._uas = fresh
 
 
 __all__ = ["UserAgentPool"]
@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import logging.config
 from pathlib import Path
+from threading import Lock
 from typing import Iterable
 
 import structlog
 
 _LOGGING_INITIALISED = False
+# 已完成文件处理器初始化的来源 → 绑定好的 logger，避免每次调用都 mkdir/扫描 handler
+_INITIALIZED_SOURCES: dict[str, structlog.BoundLogger] = {}
+_SOURCE_LOCK = Lock()
+_TAIL_BLOCK_SIZE = 8192
+_STACK_INFO_RENDERER = structlog.processors.StackInfoRenderer()
+
+
+def _render_exc_info(logger: object, method_name: str, event_dict: dict) -> dict:
+    """仅在事件携带 exc_info/stack_info 时才渲染异常与调用栈。"""
+
+    if "exc_info" in event_dict or "stack_info" in event_dict:
+        event_dict = _STACK_INFO_RENDERER(logger, method_name, event_dict)
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
 
 
 def _default_log_dir() -> Path:
@@ -20,16 +36,16 @@ def configure_logging(verbose: bool = False) -> structlog.BoundLogger:
     """Configure structlog + stdlib handlers and return application logger."""
 
     global _LOGGING_INITIALISED
-    log_dir = _default_log_dir()
-    error_log = log_dir / "error.log"
-    crawler_log = log_dir / "crawler.log"
-    sources_dir = log_dir / "sources"
-    sources_dir.mkdir(parents=True, exist_ok=True)
-    log_dir.mkdir(parents=True, exist_ok=True)
-    error_log.touch(exist_ok=True)
-    crawler_log.touch(exist_ok=True)
-
     if not _LOGGING_INITIALISED:
+        log_dir = _default_log_dir()
+        error_log = log_dir / "error.log"
+        crawler_log = log_dir / "crawler.log"
+        sources_dir = log_dir / "sources"
+        sources_dir.mkdir(parents=True, exist_ok=True)
+        log_dir.mkdir(parents=True, exist_ok=True)
+        error_log.touch(exist_ok=True)
+        crawler_log.touch(exist_ok=True)
+
         level = "DEBUG" if verbose else "INFO"
         # Configure stdlib logging (console + files)
         logging.config.dictConfig(
@@ -79,11 +95,14 @@ def configure_logging(verbose: bool = False) -> structlog.BoundLogger:
                 structlog.contextvars.merge_contextvars,
                 structlog.processors.TimeStamper(fmt="iso"),
                 structlog.stdlib.add_log_level,
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
+                _render_exc_info,
                 # Wrap for stdlib formatter; keep JSON formatting at handler level
                 structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
             ],
+            # 低于配置级别的调用在包装层直接返回，不进入处理器链
+            wrapper_class=structlog.make_filtering_bound_logger(
+                logging.DEBUG if verbose else logging.INFO
+            ),
             logger_factory=structlog.stdlib.LoggerFactory(),
             cache_logger_on_first_use=True,
         )
@@ -94,25 +113,35 @@ def configure_logging(verbose: bool = False) -> structlog.BoundLogger:
 def source_logger(source_name: str, verbose: bool = False) -> structlog.BoundLogger:
     """Return a logger bound to a specific source and ensure file handler exists."""
 
-    logger = configure_logging(verbose)
-    source_log_path = _default_log_dir() / "sources" / f"{source_name}.log"
-    source_log_path.parent.mkdir(parents=True, exist_ok=True)
-
-    logger_name = f"intelli_crawler.source.{source_name}"
-    py_logger = logging.getLogger(logger_name)
-    if not any(
-        isinstance(handler, logging.FileHandler) and handler.baseFilename == str(source_log_path)
-        for handler in py_logger.handlers
-    ):
-        file_handler = logging.FileHandler(source_log_path, encoding="utf-8")
-        # Reuse the same JSON formatter as global logger
-        global_logger = logging.getLogger("intelli_crawler")
-        if global_logger.handlers:
-            file_handler.setFormatter(global_logger.handlers[0].formatter)
-        file_handler.setLevel(logging.INFO)
-        py_logger.addHandler(file_handler)
-
-    return structlog.get_logger(logger_name).bind(source=source_name)
+    cached = _INITIALIZED_SOURCES.get(source_name)
+    if cached is not None:
+        return cached
+
+    configure_logging(verbose)
+    with _SOURCE_LOCK:
+        cached = _INITIALIZED_SOURCES.get(source_name)
+        if cached is not None:
+            return cached
+        source_log_path = _default_log_dir() / "sources" / f"{source_name}.log"
+        source_log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        logger_name = f"intelli_crawler.source.{source_name}"
+        py_logger = logging.getLogger(logger_name)
+        # 记录已挂载的日志路径，替代逐个 handler 比较 baseFilename
+        attached_paths: set[str] = py_logger.__dict__.setdefault("_paths", set())
+        if str(source_log_path) not in attached_paths:
+            file_handler = logging.FileHandler(source_log_path, encoding="utf-8")
+            # Reuse the same JSON formatter as global logger
+            global_logger = logging.getLogger("intelli_crawler")
+            if global_logger.handlers:
+                file_handler.setFormatter(global_logger.handlers[0].formatter)
+            file_handler.setLevel(logging.INFO)
+            py_logger.addHandler(file_handler)
+            attached_paths.add(str(source_log_path))
+
+        bound = structlog.get_logger(logger_name).bind(source=source_name)
+        _INITIALIZED_SOURCES[source_name] = bound
+        return bound
 
 
 def tail_log(path: Path, line_count: int = 100) -> list[str]:
@@ -120,7 +149,23 @@ def tail_log(path: Path, line_count: int = 100) -> list[str]:
 
     if not path.exists():
         return []
-    with path.open("r", encoding="utf-8", errors="ignore") as stream:
+    if line_count <= 0:
+        with path.open("r", encoding="utf-8", errors="ignore") as stream:
+            return stream.readlines()
+    # 从文件末尾按块倒读，直到凑够 N+1 个换行，只解码尾部
+    with path.open("rb") as stream:
+        position = stream.seek(0, io.SEEK_END)
+        chunks: list[bytes] = []
+        newlines = 0
+        while position > 0 and newlines <= line_count:
+            step = min(_TAIL_BLOCK_SIZE, position)
+            position -= step
+            stream.seek(position)
+            chunk = stream.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    tail = b"".join(reversed(chunks))
+    with io.TextIOWrapper(io.BytesIO(tail), encoding="utf-8", errors="ignore") as stream:
         lines = stream.readlines()
     return lines[-line_count:]
 
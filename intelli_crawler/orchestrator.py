@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from concurrent.futures import Future, as_completed
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
 from threading import Lock
 from typing import Callable, Iterable
@@ -16,12 +17,35 @@ import structlog
 from rich.console import Console
 
 from .config import ConfigRepository, GlobalConfig, SourceConfig
-from .engine import DeduplicationStore, FetchRequest, Fetcher, Parser, ThreadPoolManager
-from .engine.exporter import BaseExporter, FileExporter, MongoExporter, SQLiteExporter
+from .engine import (
+    DeduplicationStore,
+    FetchRequest,
+    FetchResponse,
+    Fetcher,
+    Parser,
+    ThreadPoolManager,
+)
+from .engine.exporter import (
+    BaseExporter,
+    FileExporter,
+    MongoExporter,
+    QueuedExporter,
+    SQLiteExporter,
+)
 from .infra import ProxyPool, SQLiteManager, UserAgentPool
 from .logging_conf import configure_logging, source_logger
 from .ui import ProgressReporter, ProgressActivity
 
+try:  # optional C ISO-8601 parser
+    import ciso8601
+except ImportError:  # pragma: no cover - import guard
+    ciso8601 = None
+
+try:  # optional vectorised window prefilter
+    import numpy as np
+except ImportError:  # pragma: no cover - import guard
+    np = None
+
 
 @dataclass(slots=True)
 class CrawlWindow:
@@ -29,12 +53,22 @@ class CrawlWindow:
 
     start: datetime
     end: datetime
+    # 日志中反复使用的 ISO 字符串只格式化一次
+    start_iso: str = field(init=False, repr=False, compare=False)
+    end_iso: str = field(init=False, repr=False, compare=False)
+    # POSIX 秒数边界，逐条窗口判断只做浮点比较
+    start_ts: float = field(init=False, repr=False, compare=False)
+    end_ts: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.start = self._normalise(self.start)
         self.end = self._normalise(self.end)
         if self.end <= self.start:
             raise ValueError("CrawlWindow end must be greater than start")
+        self.start_iso = self.start.isoformat()
+        self.end_iso = self.end.isoformat()
+        self.start_ts = self.start.timestamp()
+        self.end_ts = self.end.timestamp()
 
     @staticmethod
     def _normalise(value: datetime) -> datetime:
@@ -46,6 +80,89 @@ class CrawlWindow:
         return self.start, self.end
 
 
+# 非 ISO 时间字符串按形状 (是否带年份, 日期分隔符, 冒号数量) 直接定位唯一格式
+_DATETIME_FORMATS: dict[tuple[bool, str, int], str] = {
+    (True, "-", 2): "%Y-%m-%d %H:%M:%S",
+    (True, "-", 1): "%Y-%m-%d %H:%M",
+    (True, "/", 2): "%Y/%m/%d %H:%M:%S",
+    (True, "/", 1): "%Y/%m/%d %H:%M",
+    (True, "-", 0): "%Y-%m-%d",
+    (True, "/", 0): "%Y/%m/%d",
+    (False, "-", 1): "%m-%d %H:%M",
+    (False, "/", 1): "%m/%d %H:%M",
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_text(text: str) -> tuple[datetime, bool] | None:
+    """Parse a stripped timestamp string into ``(datetime, has_year)``; pure, hence cached."""
+
+    normalised = text[:-1] + "+00:00" if text.endswith("Z") else text
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime(normalised), True
+        except ValueError:
+            pass
+    try:
+        return datetime.fromisoformat(normalised), True
+    except ValueError:
+        pass
+    has_year = normalised[:4].isdigit() and normalised[4:5] in ("-", "/")
+    date_part, _, time_part = normalised.partition(" ")
+    separator = "-" if "-" in date_part else "/"
+    fmt = _DATETIME_FORMATS.get((has_year, separator, time_part.count(":")))
+    if fmt is None:
+        return None
+    try:
+        return datetime.strptime(normalised, fmt), has_year
+    except ValueError:
+        return None
+
+
+def _playwright_available() -> bool:
+    try:  # detect optional dependency
+        import playwright  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_SUMMARY_WIDTH = 240
+# 摘要只需正文开头，先截取再交给 textwrap.shorten，避免对长正文整体分词
+_SUMMARY_HEAD = 512
+
+
+def _summarise(content: str) -> str:
+    head = content[:_SUMMARY_HEAD].replace("\n", " ").strip()
+    if len(content) > _SUMMARY_HEAD and len(" ".join(head.split())) <= _SUMMARY_WIDTH:
+        # 开头空白过多时截取不足以判断是否需要省略号，回退到完整正文
+        head = content.replace("\n", " ").strip()
+    return textwrap.shorten(head, width=_SUMMARY_WIDTH, placeholder="…")
+
+
+# 记录时间字段按优先级排列，窗口判断取第一个可解析的值
+_TS_FIELDS = (
+    "published_at",
+    "published_at_utc",
+    "publish_time",
+    "publishTimestamp",
+    "timestamp",
+    "time",
+    "fetched_at",
+)
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+# 入口页站点专用抽取器，按注册域名索引；未命中的站点走通用 extract_list_records
+EntryExtractor = Callable[[Parser, str, str], "dict[str, dict[str, object]]"]
+_ENTRY_EXTRACTORS: dict[str, EntryExtractor] = {
+    "foresightnews.pro": Parser.extract_foresight_records,
+    "odaily.news": Parser.extract_odaily_records,
+    "xueqiu.com": Parser.extract_xueqiu_records,
+}
+
+
 class Orchestrator:
     """Central coordinator managing lifecycle of crawl tasks."""
 
@@ -66,7 +183,19 @@ class Orchestrator:
         self.proxy_pool = proxy_pool
         self.ua_pool = ua_pool
         self.logger = configure_logging().bind(component="orchestrator")
-        self._export_lock = Lock()
+        self._detail_logger = self.logger.bind(component="detail")
+        # 源配置按文件 mtime 缓存，去重存储随配置对象复用，避免每次调度都重新解析 YAML
+        self._source_cache: dict[str, tuple[int, SourceConfig, DeduplicationStore | None]] = {}
+        self._source_cache_lock = Lock()
+        # 入口页请求只依赖源配置，随缓存的配置对象复用（Fetcher 不会修改请求）
+        self._entry_requests: dict[str, tuple[SourceConfig, FetchRequest]] = {}
+        self._playwright_available = _playwright_available()
+        # 每个源复用同一个 Fetcher（连接池、Cookie、浏览器会话），配置重载或删除时淘汰；
+        # 仍有运行在用的旧 Fetcher 等最后一个运行结束后再关闭
+        self._fetchers: dict[str, Fetcher] = {}
+        self._fetcher_runs: dict[Fetcher, int] = {}
+        self._fetchers_lock = Lock()
+        self._entry_extractors: dict[str, EntryExtractor] = dict(_ENTRY_EXTRACTORS)
         # 控制台用于在部分终端打印可见的文本进度行
         try:
             self._console = Console()
@@ -76,6 +205,7 @@ class Orchestrator:
     # ------------------------------------------------------------------
     def register_schedules(self, sources: Iterable[SourceConfig]) -> None:
         for source in sources:
+            self._load_source(source.source_name)
             self.scheduler.schedule_source(source, self.run_source_async)
         self.scheduler.start()
 
@@ -89,14 +219,33 @@ class Orchestrator:
         progress_factory: Callable[[str], "ProgressReporter"] | None = None,
         window: CrawlWindow | None = None,
     ) -> dict:
-        source = self.config_repository.load_source(source_name)
+        run = self._open_run(source_name, progress_enabled, progress_factory, window)
+        try:
+            detail_urls, prefetched_records = self._collect_details(run)
+            if detail_urls:
+                self._dispatch_threaded(run, detail_urls, prefetched_records)
+        finally:
+            try:
+                self._settle_exports(run)
+            finally:
+                self._close_run(run)
+        return run.summary
+
+    def _open_run(
+        self,
+        source_name: str,
+        progress_enabled: bool | None,
+        progress_factory: Callable[[str], "ProgressReporter"] | None,
+        window: CrawlWindow | None,
+    ) -> "_SourceRun":
+        source = self._load_source(source_name)
         source_log = source_logger(source.source_name)
         # 过滤窗口提示
         if window:
             source_log.info(
                 "using_crawl_window",
-                window_start=window.start.isoformat(),
-                window_end=window.end.isoformat(),
+                window_start=window.start_iso,
+                window_end=window.end_iso,
             )
         # 进度条开关：若入参提供则尊重；默认开启
         progress_flag = True if progress_enabled is None else bool(progress_enabled)
@@ -109,167 +258,385 @@ class Orchestrator:
                 progress.set_label(source.source_name)
             except Exception:
                 pass
-        fetcher = Fetcher(self.global_config, self.proxy_pool, self.ua_pool, logger=source_log)
         parser = Parser()
         run_tag = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-        exporter = self._create_exporter(source, run_tag)
-        dedup_store = DeduplicationStoreFactory.build(self.storage, self.global_config, source)
+        # 写入交给后台写线程批量完成，工作线程只负责入队
+        exporter = QueuedExporter(self._create_exporter(source, run_tag))
+        dedup_store = self._dedup_store_for(source)
+        return _SourceRun(
+            source=source,
+            window=window,
+            progress=progress,
+            progress_flag=progress_flag,
+            # 最后再占用 Fetcher，前面任一步失败都不会留下未释放的引用
+            fetcher=self._fetcher_for(source.source_name, source_log),
+            parser=parser,
+            exporter=exporter,
+            dedup_store=dedup_store,
+            summary={"success": 0, "failed": 0, "skipped": 0, "window_filtered": 0},
+        )
+
+    def close(self) -> None:
+        """Release the per-source fetchers kept alive across runs."""
+
+        with self._fetchers_lock:
+            fetchers = list(self._fetchers.values())
+            self._fetchers.clear()
+        for fetcher in fetchers:
+            self._close_fetcher(fetcher)
+
+    def forget_source(self, source_name: str) -> None:
+        """Drop everything cached for ``source_name``, e.g. after its config was deleted."""
 
-        summary: dict[str, int] = {"success": 0, "failed": 0, "skipped": 0, "window_filtered": 0}
+        with self._source_cache_lock:
+            self._source_cache.pop(source_name, None)
+            self._entry_requests.pop(source_name, None)
+        self._evict_fetcher(source_name)
 
+    def register_entry_extractor(self, domain: str, extractor: EntryExtractor) -> None:
+        """Route entry pages on ``domain`` to ``extractor``.
+
+        ``domain`` is the registered domain, e.g. ``example.com``.
+        """
+
+        self._entry_extractors[domain.lower()] = extractor
+
+    def _fetcher_for(self, source_name: str, source_log: structlog.BoundLogger) -> Fetcher:
+        """Return the source's shared fetcher; pair every call with :meth:`_release_fetcher`."""
+
+        with self._fetchers_lock:
+            fetcher = self._fetchers.get(source_name)
+            if fetcher is None:
+                fetcher = Fetcher(
+                    self.global_config, self.proxy_pool, self.ua_pool, logger=source_log
+                )
+                self._fetchers[source_name] = fetcher
+            self._fetcher_runs[fetcher] = self._fetcher_runs.get(fetcher, 0) + 1
+            return fetcher
+
+    def _release_fetcher(self, source_name: str, fetcher: Fetcher) -> None:
+        with self._fetchers_lock:
+            remaining = self._fetcher_runs.get(fetcher, 1) - 1
+            if remaining > 0:
+                self._fetcher_runs[fetcher] = remaining
+                return
+            self._fetcher_runs.pop(fetcher, None)
+            retired = self._fetchers.get(source_name) is not fetcher
+        if retired:
+            self._close_fetcher(fetcher)
+
+    def _evict_fetcher(self, source_name: str) -> None:
+        with self._fetchers_lock:
+            fetcher = self._fetchers.pop(source_name, None)
+            in_use = fetcher is not None and fetcher in self._fetcher_runs
+        if fetcher is not None and not in_use:
+            self._close_fetcher(fetcher)
+
+    @staticmethod
+    def _close_fetcher(fetcher: Fetcher) -> None:
         try:
-            # 在未知总量阶段先显示不确定进度（活动指示器或多源任务占位）
-            indeterminate_supported = hasattr(progress, "start_indeterminate")
-            entry_activity: ProgressActivity | None = None
-            if indeterminate_supported:
-                # 多源进度：创建任务并显示旋转指示器
+            fetcher.close()
+        except Exception:  # noqa: BLE001
+            pass
+
+    def _load_source(self, source_name: str) -> SourceConfig:
+        """Return the source config, re-reading the file only when its mtime changed."""
+
+        try:
+            mtime = self.config_repository.source_path(source_name).stat().st_mtime_ns
+        except FileNotFoundError:
+            # 配置文件已被删除：释放该源缓存的配置与 Fetcher
+            self.forget_source(source_name)
+            return self.config_repository.load_source(source_name)
+        except (OSError, TypeError, AttributeError):
+            return self.config_repository.load_source(source_name)
+        with self._source_cache_lock:
+            cached = self._source_cache.get(source_name)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        if cached is not None:
+            # 配置已变更，旧 Fetcher 可能带着过时的代理、UA 或浏览器设置
+            self._evict_fetcher(source_name)
+        source = self.config_repository.load_source(source_name)
+        with self._source_cache_lock:
+            self._source_cache[source_name] = (mtime, source, None)
+        return source
+
+    def _dedup_store_for(self, source: SourceConfig) -> DeduplicationStore:
+        with self._source_cache_lock:
+            cached = self._source_cache.get(source.source_name)
+            if cached is not None and cached[1] is source:
+                if cached[2] is None:
+                    store = DeduplicationStoreFactory.build(
+                        self.storage, self.global_config, source
+                    )
+                    self._source_cache[source.source_name] = (cached[0], source, store)
+                    return store
+                return cached[2]
+        return DeduplicationStoreFactory.build(self.storage, self.global_config, source)
+
+    def _entry_request(self, source: SourceConfig) -> FetchRequest:
+        """Return the entry-page request for ``source``, built once per loaded config object."""
+
+        with self._source_cache_lock:
+            cached = self._entry_requests.get(source.source_name)
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        request = FetchRequest(
+            url=source.target_url,
+            force_browser=source.use_entry_content,
+            # 为动态入口页在浏览器中等待列表选择器渲染完成
+            wait_selector=(
+                source.entry_interactions.wait_selector or source.entry_pattern
+                if source.use_entry_content
+                else None
+            ),
+            # 入口滚动与点击交互（可选）
+            scroll_rounds=source.entry_interactions.scroll_rounds,
+            scroll_pause_ms=source.entry_interactions.scroll_pause_ms,
+            click_more_selector=source.entry_interactions.click_more_selector,
+            click_more_times=source.entry_interactions.click_more_times,
+            click_wait_selector=source.entry_interactions.click_wait_selector,
+            auto_interactions=source.entry_interactions.auto,
+            auto_max_rounds=source.entry_interactions.auto_max_rounds,
+            auto_stall_rounds=source.entry_interactions.auto_stall_rounds,
+            prefer_scroll_first=source.entry_interactions.prefer_scroll_first,
+        )
+        with self._source_cache_lock:
+            self._entry_requests[source.source_name] = (source, request)
+        return request
+
+    def _collect_details(
+        self, run: "_SourceRun"
+    ) -> tuple[list[str], dict[str, dict[str, object]]]:
+        """Fetch the entry page and return the detail URLs still to process.
+
+        Also returns the records already extracted from the entry page, keyed by URL.
+        """
+
+        source, progress, parser = run.source, run.progress, run.parser
+        # 在未知总量阶段先显示不确定进度（活动指示器或多源任务占位）
+        indeterminate_supported = hasattr(progress, "start_indeterminate")
+        entry_activity: ProgressActivity | None = None
+        if indeterminate_supported:
+            # 多源进度：创建任务并显示旋转指示器
+            try:
+                progress.start_indeterminate()  # type: ignore[attr-defined]
+            except Exception:
+                pass
+        else:
+            # 单源进度：使用 Rich 状态旋转指示器
+            entry_activity = ProgressActivity(enabled=run.progress_flag)
+            entry_activity.start("正在获取入口页面（可能使用无头浏览器），请稍候…")
+
+        entry_response = run.fetcher.fetch(source, self._entry_request(source))
+        if entry_activity is not None:
+            entry_activity.close()
+        # 入口页内容模式优先用站点抽取器产出记录，命中时无需再解析一遍入口链接
+        prefetched_records: dict[str, dict[str, object]] = {}
+        if source.use_entry_content:
+            hostname = urlparse(entry_response.url).hostname or ""
+            # 按注册域名 (example.com) 一次查表定位站点专用抽取器
+            extractor = self._entry_extractors.get(".".join(hostname.rsplit(".", 2)[-2:]))
+            if extractor is not None:
+                prefetched_records = extractor(parser, entry_response.text, entry_response.url)
+            else:
+                # 通用入口页记录抽取：使用 entry_pattern 与 detail_pattern 从列表页直接产出记录
                 try:
-                    progress.start_indeterminate()  # type: ignore[attr-defined]
+                    prefetched_records = parser.extract_list_records(  # type: ignore[assignment]
+                        source, entry_response.text, entry_response.url
+                    )
                 except Exception:
-                    pass
-            else:
-                # 单源进度：使用 Rich 状态旋转指示器
-                entry_activity = ProgressActivity(enabled=progress_flag)
-                entry_activity.start("正在获取入口页面（可能使用无头浏览器），请稍候…")
-
-            entry_response = fetcher.fetch(
-                source,
-                FetchRequest(
-                    url=source.target_url,
-                    force_browser=source.use_entry_content,
-                    # 为动态入口页在浏览器中等待列表选择器渲染完成
-                    wait_selector=(
-                        source.entry_interactions.wait_selector or source.entry_pattern
-                        if source.use_entry_content
-                        else None
-                    ),
-                    # 入口滚动与点击交互（可选）
-                    scroll_rounds=source.entry_interactions.scroll_rounds,
-                    scroll_pause_ms=source.entry_interactions.scroll_pause_ms,
-                    click_more_selector=source.entry_interactions.click_more_selector,
-                    click_more_times=source.entry_interactions.click_more_times,
-                    click_wait_selector=source.entry_interactions.click_wait_selector,
-                    auto_interactions=source.entry_interactions.auto,
-                    auto_max_rounds=source.entry_interactions.auto_max_rounds,
-                    auto_stall_rounds=source.entry_interactions.auto_stall_rounds,
-                    prefer_scroll_first=source.entry_interactions.prefer_scroll_first,
-                ),
-            )
-            if entry_activity is not None:
-                entry_activity.close()
+                    prefetched_records = {}
+        if prefetched_records:
+            detail_urls = list(prefetched_records.keys())
+        else:
             detail_urls = parser.parse_entries(source, entry_response.text, entry_response.url)
             if not detail_urls:
                 detail_urls = [source.target_url]
-            initial_total = len(detail_urls)
+        initial_total = len(detail_urls)
 
-            # 简洁进度条显示
-            def _bar(done: int, total: int, width: int = 20) -> str:
-                filled = int(width * (done / total)) if total > 0 else 0
-                return "#" * filled + "." * (width - filled)
+        # 在确定总量后，切换到确定进度（若支持）；否则初始化单源进度
+        try:
+            if hasattr(progress, "set_total"):
+                progress.set_total(initial_total)  # type: ignore[attr-defined]
+            elif hasattr(progress, "start"):
+                progress.start(initial_total)  # type: ignore[attr-defined]
+        except Exception:
+            # 进度切换失败不影响抓取流程
+            pass
+
+        if prefetched_records and run.window is not None:
+            prefetched_records = self._prefilter_window(run, prefetched_records)
+            detail_urls = list(prefetched_records.keys())
+
+        if source.enable_incremental:
+            known_urls = run.dedup_store.has_urls(detail_urls)
+            filtered_urls = [url for url in detail_urls if url not in known_urls]
+            dedup_skipped = len(detail_urls) - len(filtered_urls)
+            if dedup_skipped:
+                run.summary["skipped"] += dedup_skipped
+            detail_urls = filtered_urls
+            if prefetched_records:
+                prefetched_records = {
+                    url: prefetched_records[url]
+                    for url in detail_urls
+                    if url in prefetched_records
+                }
 
-            # 在确定总量后，切换到确定进度（若支持）；否则初始化单源进度
+        if not detail_urls:
+            return [], {}
+
+        # 现在已知总量：若先前为不确定任务，则设置总量；否则正常启动进度条
+        if indeterminate_supported:
             try:
-                if hasattr(progress, "set_total"):
-                    progress.set_total(initial_total)  # type: ignore[attr-defined]
-                elif hasattr(progress, "start"):
-                    progress.start(initial_total)  # type: ignore[attr-defined]
+                progress.set_total(len(detail_urls))  # type: ignore[attr-defined]
             except Exception:
-                # 进度切换失败不影响抓取流程
                 pass
+        else:
+            progress.start(total=len(detail_urls))
+        return detail_urls, prefetched_records
+
+    def _prefilter_window(
+        self, run: "_SourceRun", prefetched_records: dict[str, dict[str, object]]
+    ) -> dict[str, dict[str, object]]:
+        """Drop prefetched records outside the crawl window before any detail work is scheduled."""
+
+        window = run.window
+        assert window is not None
+        fallback_year = window.start.year
+        start_ts, end_ts = window.start_ts, window.end_ts
+        # 缺少时间戳的记录记为 NaN 并保留，交由逐条窗口判断处理
+        timestamps = []
+        for record in prefetched_records.values():
+            ts = self._extract_record_timestamp(record, fallback_year=fallback_year)
+            timestamps.append(ts if ts is not None else float("nan"))
+        if np is not None:
+            ts_array = np.array(timestamps, dtype="float64")
+            keep = np.isnan(ts_array) | ((ts_array >= start_ts) & (ts_array <= end_ts))
+            mask = keep.tolist()
+        else:
+            mask = [ts != ts or start_ts <= ts <= end_ts for ts in timestamps]
+        kept = {
+            url: record
+            for (url, record), keep_record in zip(prefetched_records.items(), mask, strict=True)
+            if keep_record
+        }
+        filtered = len(prefetched_records) - len(kept)
+        if filtered:
+            run.summary["skipped"] += filtered
+            run.summary["window_filtered"] += filtered
+            self.logger.info(
+                "window_prefiltered",
+                source=run.source.source_name,
+                filtered=filtered,
+                window_start=window.start_iso,
+                window_end=window.end_iso,
+            )
+        return kept
 
-            prefetched_records: dict[str, dict[str, object]] = {}
-            if source.use_entry_content:
-                hostname = urlparse(entry_response.url).hostname or ""
-                if "foresightnews.pro" in hostname:
-                    prefetched_records = parser.extract_foresight_records(
-                        entry_response.text, entry_response.url
-                    )
-                elif "odaily.news" in hostname:
-                    prefetched_records = parser.extract_odaily_records(
-                        entry_response.text, entry_response.url
-                    )
-                elif "xueqiu.com" in hostname:
-                    prefetched_records = parser.extract_xueqiu_records(
-                        entry_response.text, entry_response.url
-                    )
-                else:
-                    # 通用入口页记录抽取：使用 entry_pattern 与 detail_pattern 从列表页直接产出记录
-                    try:
-                        prefetched_records = parser.extract_list_records(source, entry_response.text, entry_response.url)  # type: ignore[assignment]
-                    except Exception:
-                        prefetched_records = {}
-            if prefetched_records:
-                detail_urls = list(prefetched_records.keys())
-
-            if source.enable_incremental:
-                filtered_urls: list[str] = []
-                dedup_skipped = 0
-                for target_url in detail_urls:
-                    if dedup_store.has_url(target_url):
-                        dedup_skipped += 1
-                    else:
-                        filtered_urls.append(target_url)
-                if dedup_skipped:
-                    summary["skipped"] += dedup_skipped
-                detail_urls = filtered_urls
-                if prefetched_records:
-                    prefetched_records = {
-                        url: prefetched_records[url]
-                        for url in detail_urls
-                        if url in prefetched_records
-                    }
+    def _dispatch_threaded(
+        self,
+        run: "_SourceRun",
+        detail_urls: list[str],
+        prefetched_records: dict[str, dict[str, object]],
+    ) -> None:
+        source = run.source
+        if source.anti_scraping_strategies.use_headless_browser:
+            # Playwright 会话按线程缓存，无头浏览器源固定在专属单线程池上，只启动一个浏览器
+            executor = self.thread_pool.get(source.source_name, max_workers=1)
+            submit: Callable[..., Future[ProcessingResult]] = executor.submit
+            window_size = 2
+        else:
+            submit = partial(self.thread_pool.submit, source.source_name)
+            window_size = 2 * self.thread_pool.default_workers
+        # 有界在途窗口：完成一个再补交一个，避免一次性为全部 URL 创建 Future
+        pending_urls = iter(detail_urls)
+        in_flight: dict[Future[ProcessingResult], str] = {}
+
+        def _submit_next() -> bool:
+            detail_url = next(pending_urls, None)
+            if detail_url is None:
+                return False
+            future = submit(
+                self._process_detail,
+                run.fetcher,
+                run.parser,
+                run.dedup_store,
+                run.exporter,
+                source,
+                detail_url,
+                run.window,
+                # 提交后即释放预取记录的引用
+                prefetched_records.pop(detail_url, None) if prefetched_records else None,
+            )
+            in_flight[future] = detail_url
+            return True
 
-            if not detail_urls:
-                return summary
+        while len(in_flight) < window_size and _submit_next():
+            pass
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                del in_flight[future]
+                self._record_result(run, future.result())
+                _submit_next()
 
-            # 现在已知总量：若先前为不确定任务，则设置总量；否则正常启动进度条
-            if indeterminate_supported:
+    @staticmethod
+    def _record_result(run: "_SourceRun", result: "ProcessingResult") -> None:
+        progress, summary = run.progress, run.summary
+        if result.export is not None:
+            run.pending_exports.append(result)
+        if result.status == "success":
+            progress.advance(success=True, current_url=result.url)
+            summary["success"] += 1
+        elif result.status == "skipped":
+            progress.advance(skipped=True, current_url=result.url)
+            summary["skipped"] += 1
+            if result.reason == "window_filtered":
+                summary["window_filtered"] += 1
+        else:
+            progress.advance(failed=True, current_url=result.url)
+            summary["failed"] += 1
+
+    def _settle_exports(self, run: "_SourceRun") -> None:
+        """Wait for the run's queued exports and roll back the records that failed to write.
+
+        A failed record is counted as failed rather than successful, and its URL is dropped
+        from the dedup history so the next incremental run crawls it again.
+        """
+
+        source_name = run.source.source_name
+        for result in run.pending_exports:
+            assert result.export is not None
+            error = result.export.exception()
+            if error is None:
+                continue
+            # 进度条已按成功推进，这里只修正汇总计数
+            run.summary["success"] -= 1
+            run.summary["failed"] += 1
+            self._detail_logger.error(
+                "export_failed", url=result.url, source=source_name, error=str(error)
+            )
+            if result.discard_on_failure:
                 try:
-                    progress.set_total(len(detail_urls))  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-            else:
-                progress.start(total=len(detail_urls))
-
-            max_workers = 1 if source.anti_scraping_strategies.use_headless_browser else None
-            completed = 0
-            executor = self.thread_pool.get(source.source_name, max_workers=max_workers)
-            futures: list[Future[ProcessingResult]] = []
-            for detail_url in detail_urls:
-                futures.append(
-                    executor.submit(
-                        self._process_detail,
-                        fetcher,
-                        parser,
-                        dedup_store,
-                        exporter,
-                        source,
-                        detail_url,
-                        window,
-                        prefetched_records.get(detail_url) if prefetched_records else None,
+                    run.dedup_store.discard(result.url)
+                except Exception as exc:  # noqa: BLE001
+                    self._detail_logger.error(
+                        "dedup_rollback_failed", url=result.url, source=source_name, error=str(exc)
                     )
-                )
+        run.pending_exports.clear()
 
-            for future in as_completed(futures):
-                result = future.result()
-                if result.status == "success":
-                    progress.advance(success=True, current_url=result.url)
-                    summary["success"] += 1
-                elif result.status == "skipped":
-                    progress.advance(skipped=True, current_url=result.url)
-                    summary["skipped"] += 1
-                    if result.reason == "window_filtered":
-                        summary["window_filtered"] += 1
-                else:
-                    progress.advance(failed=True, current_url=result.url)
-                    summary["failed"] += 1
-                completed += 1
+    def _close_run(self, run: "_SourceRun") -> None:
+        try:
+            run.progress.close()
+            try:
+                run.exporter.flush()
+            finally:
+                run.exporter.close()
         finally:
-            progress.close()
-            exporter.flush()
-            exporter.close()
-            fetcher.close()
-        return summary
+            self._release_fetcher(run.source.source_name, run.fetcher)
 
     def _process_detail(
         self,
@@ -284,59 +651,86 @@ class Orchestrator:
     ) -> "ProcessingResult":
         try:
             if prefetched is not None:
-                enriched = self._enrich_record(prefetched, source, url)
-                valid, reason = self._validate_record(enriched, strict=False)
-                if valid:
-                    status = "success"
-                    reason = None
-                else:
-                    status = "invalid"
+                status, enriched, reason = self._validate_prefetched(prefetched, source, url)
             else:
                 status, enriched, reason = self._fetch_and_validate(
                     fetcher, parser, source, url, force_browser=False
                 )
-            if status == "skipped":
-                return ProcessingResult(status="skipped", url=url, reason=reason)
             if status == "invalid" and self._should_force_browser(source):
-                try:
-                    status, enriched, reason = self._fetch_and_validate(
-                        fetcher, parser, source, url, force_browser=True
-                    )
-                except Exception as exc:  # noqa: BLE001
-                    structlog.get_logger("intelli_crawler").warning(
-                        "browser_fallback_failed",
-                        url=url,
-                        source=source.source_name,
-                        error=str(exc),
-                    )
-                    status, reason = "failed", str(exc)
-            if status != "success":
-                return ProcessingResult(
-                    status="failed", url=url, reason=reason or "validation_failed"
-                )
-            if window and not self._within_window(enriched, window, source.source_name):
-                self.logger.info(
-                    "window_filtered",
-                    source=source.source_name,
-                    url=url,
-                    window_start=window.start.isoformat(),
-                    window_end=window.end.isoformat(),
-                )
-                return ProcessingResult(status="skipped", url=url, reason="window_filtered")
-
-            content_seed = enriched.get("content") or enriched.get("raw_html") or ""
-            dedup_result = dedup_store.check_and_store(url, content_seed, source.source_name)
-            if source.enable_incremental and dedup_result.is_duplicate:
-                return ProcessingResult(status="skipped", url=url, reason="duplicate")
-            with self._export_lock:
-                exporter.export(enriched)
-            return ProcessingResult(status="success", url=url, reason=None)
+                status, enriched, reason = self._browser_fallback(fetcher, parser, source, url)
+            return self._finalise_detail(
+                dedup_store, exporter, source, url, window, status, enriched, reason
+            )
         except Exception as exc:  # noqa: BLE001
-            structlog.get_logger("intelli_crawler").error(
+            self._detail_logger.error(
                 "detail_error", url=url, source=source.source_name, error=str(exc)
             )
             return ProcessingResult(status="failed", url=url, reason=str(exc))
 
+    def _validate_prefetched(
+        self, prefetched: dict[str, object], source: SourceConfig, url: str
+    ) -> tuple[str, dict[str, object] | None, str | None]:
+        enriched = self._enrich_record(prefetched, source, url)
+        valid, reason = self._validate_record(enriched, strict=False)
+        if valid:
+            return "success", enriched, None
+        return "invalid", enriched, reason
+
+    def _browser_fallback(
+        self, fetcher: Fetcher, parser: Parser, source: SourceConfig, url: str
+    ) -> tuple[str, dict[str, object] | None, str | None]:
+        try:
+            return self._fetch_and_validate(fetcher, parser, source, url, force_browser=True)
+        except Exception as exc:  # noqa: BLE001
+            self._detail_logger.warning(
+                "browser_fallback_failed",
+                url=url,
+                source=source.source_name,
+                error=str(exc),
+            )
+            return "failed", None, str(exc)
+
+    def _finalise_detail(
+        self,
+        dedup_store: DeduplicationStore,
+        exporter: BaseExporter,
+        source: SourceConfig,
+        url: str,
+        window: CrawlWindow | None,
+        status: str,
+        enriched: dict[str, object] | None,
+        reason: str | None,
+    ) -> "ProcessingResult":
+        if status == "skipped":
+            return ProcessingResult(status="skipped", url=url, reason=reason)
+        if status != "success" or enriched is None:
+            return ProcessingResult(
+                status="failed", url=url, reason=reason or "validation_failed"
+            )
+        if window and not self._within_window(enriched, window, source.source_name):
+            self.logger.info(
+                "window_filtered",
+                source=source.source_name,
+                url=url,
+                window_start=window.start_iso,
+                window_end=window.end_iso,
+            )
+            return ProcessingResult(status="skipped", url=url, reason="window_filtered")
+
+        content_seed = enriched.get("content") or enriched.get("raw_html") or ""
+        dedup_result = dedup_store.check_and_store(url, content_seed, source.source_name)
+        if source.enable_incremental and dedup_result.is_duplicate:
+            return ProcessingResult(status="skipped", url=url, reason="duplicate")
+        # 只入队不等待写出；写出结果在运行收尾时由 _settle_exports 统一结算，
+        # 失败时撤销本次新增的历史记录，否则增量模式会永久跳过该 URL
+        return ProcessingResult(
+            status="success",
+            url=url,
+            reason=None,
+            export=exporter.submit(enriched),
+            discard_on_failure=not dedup_result.is_duplicate,
+        )
+
     def _fetch_and_validate(
         self,
         fetcher: Fetcher,
@@ -347,41 +741,49 @@ class Orchestrator:
         force_browser: bool,
     ) -> tuple[str, dict[str, object] | None, str | None]:
         response = fetcher.fetch(source, FetchRequest(url=url, force_browser=force_browser))
+        return self._validate_response(parser, source, url, response)
+
+    def _validate_response(
+        self, parser: Parser, source: SourceConfig, url: str, response: FetchResponse
+    ) -> tuple[str, dict[str, object] | None, str | None]:
         record = parser.parse_detail(source, response.text, url)
         if not parser.filter_by_keywords(record, source.keywords_filter):
             return "skipped", None, "keyword"
-        enriched = self._enrich_record(record.data, source, url)
+        enriched = self._enrich_record(record.data, source, url, raw_html=response.text)
         valid, reason = self._validate_record(enriched)
         if not valid:
             return "invalid", None, reason
         return "success", enriched, None
 
     def _enrich_record(
-        self, data: dict[str, object], source: SourceConfig, url: str
+        self,
+        data: dict[str, object],
+        source: SourceConfig,
+        url: str,
+        *,
+        raw_html: str | None = None,
     ) -> dict[str, object]:
-        enriched = dict(data)
-        enriched.setdefault("url", url)
-        enriched.setdefault("source_name", source.source_name)
+        # 单次合并构建：记录自身字段优先，site_type 始终以配置为准
+        enriched = {"url": url, "source_name": source.source_name, **data}
         enriched["site_type"] = source.site_type.value
-        enriched.setdefault("fetched_at", datetime.utcnow().isoformat(timespec="seconds") + "Z")
+        if "fetched_at" not in enriched:
+            enriched["fetched_at"] = datetime.utcnow().isoformat(timespec="seconds") + "Z"
         if not enriched.get("content"):
-            odaily = self._extract_odaily_from_html(enriched.get("raw_html"))
+            # keep_raw_html 关闭时记录中没有 raw_html，回退到调用方传入的原始页面
+            odaily = self._extract_odaily_from_html(enriched.get("raw_html") or raw_html)
             if odaily:
                 for key, value in odaily.items():
                     if value:
                         enriched.setdefault(key, value)
         content = enriched.get("content")
-        if isinstance(content, str):
-            summary = textwrap.shorten(
-                content.replace("\n", " ").strip(), width=240, placeholder="…"
-            )
-            enriched.setdefault("summary", summary)
+        if isinstance(content, str) and "summary" not in enriched:
+            enriched["summary"] = _summarise(content)
         return enriched
 
     def _within_window(
         self, record: dict[str, object], window: CrawlWindow, source_name: str
     ) -> bool:
-        timestamp = self._extract_record_datetime(record, fallback_year=window.start.year)
+        timestamp = self._extract_record_timestamp(record, fallback_year=window.start.year)
         if timestamp is None:
             self.logger.debug(
                 "window_timestamp_missing",
@@ -389,36 +791,52 @@ class Orchestrator:
                 url=record.get("url"),
             )
             return True
-        start, end = window.as_tuple()
-        if start <= timestamp <= end:
+        if window.start_ts <= timestamp <= window.end_ts:
             return True
         self.logger.debug(
             "window_out_of_range",
             source=source_name,
             url=record.get("url"),
-            record_timestamp=timestamp.isoformat(),
-            window_start=start.isoformat(),
-            window_end=end.isoformat(),
+            record_timestamp=datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(),
+            window_start=window.start_iso,
+            window_end=window.end_iso,
         )
         return False
 
+    def _extract_record_timestamp(
+        self,
+        record: dict[str, object],
+        *,
+        fallback_year: int | None = None,
+    ) -> float | None:
+        """Like :meth:`_extract_record_datetime` but as POSIX seconds.
+
+        Numeric fields (e.g. Odaily's millisecond ``publishTimestamp``) are converted
+        arithmetically without building a ``datetime``.
+        """
+
+        for name in _TS_FIELDS:
+            candidate = record.get(name)
+            if candidate is None:
+                continue
+            if isinstance(candidate, (int, float)):
+                numeric = float(candidate)
+                return numeric / 1000.0 if numeric > 1_000_000_000_000 else numeric
+            dt = self._coerce_datetime(candidate, fallback_year=fallback_year)
+            if dt is not None:
+                return dt.timestamp()
+        return None
+
     def _extract_record_datetime(
         self,
         record: dict[str, object],
         *,
         fallback_year: int | None = None,
     ) -> datetime | None:
-        timestamp_fields = (
-            "published_at",
-            "published_at_utc",
-            "publish_time",
-            "publishTimestamp",
-            "timestamp",
-            "time",
-            "fetched_at",
-        )
-        for field in timestamp_fields:
-            candidate = record.get(field)
+        for key in _TS_FIELDS:
+            candidate = record.get(key)
+            if candidate is None:
+                continue
             dt = self._coerce_datetime(candidate, fallback_year=fallback_year)
             if dt is not None:
                 return dt
@@ -441,33 +859,13 @@ class Orchestrator:
             text = value.strip()
             if not text:
                 return None
-            normalised = text
-            if normalised.endswith("Z"):
-                normalised = normalised[:-1] + "+00:00"
-            try:
-                dt = datetime.fromisoformat(normalised)
-            except ValueError:
-                for fmt in (
-                    "%Y-%m-%d %H:%M:%S",
-                    "%Y-%m-%d %H:%M",
-                    "%Y/%m/%d %H:%M:%S",
-                    "%Y/%m/%d %H:%M",
-                    "%Y-%m-%d",
-                    "%Y/%m/%d",
-                    "%m-%d %H:%M",
-                    "%m/%d %H:%M",
-                ):
-                    try:
-                        parsed = datetime.strptime(normalised, fmt)
-                    except ValueError:
-                        continue
-                    if "%Y" not in fmt:
-                        year = fallback_year or datetime.utcnow().year
-                        parsed = parsed.replace(year=year)
-                    dt = parsed
-                    break
-                else:
-                    return None
+            parsed = _parse_datetime_text(text)
+            if parsed is None:
+                return None
+            dt, has_year = parsed
+            if not has_year:
+                year = fallback_year or datetime.utcnow().year
+                dt = dt.replace(year=year)
         else:
             return None
         if dt.tzinfo is None:
@@ -476,27 +874,18 @@ class Orchestrator:
         return dt.astimezone(timezone.utc)
 
     def _extract_odaily_from_html(self, raw_html: object) -> dict[str, object] | None:
-        if not isinstance(raw_html, str) or '"initData"' not in raw_html:
+        if not isinstance(raw_html, str):
+            return None
+        # 单次 C 级 find 同时完成存在性判断与定位，不再先 in 再 find 扫描两遍
+        marker_index = raw_html.find('"initData"')
+        if marker_index == -1:
             return None
         try:
-            marker_index = raw_html.find('"initData"')
             start = raw_html.rfind("{", 0, marker_index)
             if start == -1:
                 return None
-            brace_count = 0
-            end = None
-            for idx in range(start, len(raw_html)):
-                ch = raw_html[idx]
-                if ch == "{":
-                    brace_count += 1
-                elif ch == "}":
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end = idx + 1
-                        break
-            if end is None:
-                return None
-            payload = json.loads(raw_html[start:end])
+            # raw_decode 由 C 扫描器从 start 处解析出恰好一个 JSON 值
+            payload, _end = _JSON_DECODER.raw_decode(raw_html, start)
             detail = payload.get("initData", {}).get("detail")
             if not isinstance(detail, dict):
                 return None
@@ -528,11 +917,7 @@ class Orchestrator:
     def _should_force_browser(self, source: SourceConfig) -> bool:
         if source.anti_scraping_strategies.use_headless_browser:
             return True
-        try:  # detect optional dependency
-            import playwright  # noqa: F401
-        except ImportError:
-            return False
-        return True
+        return self._playwright_available
 
     def _create_exporter(self, source: SourceConfig, run_tag: str) -> BaseExporter:
         base_dir = Path(self.global_config.outputs_dir)
@@ -563,11 +948,30 @@ class Orchestrator:
         self.storage.reset(path)
 
 
+@dataclass(slots=True)
+class _SourceRun:
+    """Per-run collaborators shared by the entry-page and detail stages of one run."""
+
+    source: SourceConfig
+    window: CrawlWindow | None
+    progress: "ProgressReporter"
+    progress_flag: bool
+    fetcher: Fetcher
+    parser: Parser
+    exporter: BaseExporter
+    dedup_store: DeduplicationStore
+    summary: dict[str, int]
+    # 已入队但尚未确认写出的成功结果，运行收尾时结算
+    pending_exports: list["ProcessingResult"] = field(default_factory=list)
+
+
 @dataclass(slots=True)
 class ProcessingResult:
     status: str
     url: str
     reason: str | None
+    export: Future[None] | None = field(default=None, repr=False, compare=False)
+    discard_on_failure: bool = False
 
 
 class DeduplicationStoreFactory:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Callable
 
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -14,6 +15,13 @@ from ..config import ScheduleType, SourceConfig
 from ..logging_conf import configure_logging
 
 
+@lru_cache(maxsize=256)
+def _cron_trigger(expression: str) -> CronTrigger:
+    # crontab 解析较重且 CronTrigger 不随时间变化，可在重复调度同一表达式时共享；
+    # IntervalTrigger 的 start_date 在构造时取当前时间，不能缓存
+    return CronTrigger.from_crontab(expression)
+
+
 class APSchedulerAdapter:
     """Manage APScheduler jobs for configured sources."""
 
@@ -33,6 +41,7 @@ class APSchedulerAdapter:
             self.scheduler.shutdown(wait=False)
             self.started = False
             self.logger.info("apscheduler_stopped")
+        _cron_trigger.cache_clear()
 
     def schedule_source(self, source: SourceConfig, callback: Callable[[SourceConfig], None]) -> None:
         trigger = self._build_trigger(source)
@@ -50,7 +59,7 @@ class APSchedulerAdapter:
     def _build_trigger(self, source: SourceConfig):
         schedule = source.schedule
         if schedule.type is ScheduleType.CRON:
-            return CronTrigger.from_crontab(str(schedule.value))
+            return _cron_trigger(str(schedule.value))
         if schedule.type is ScheduleType.INTERVAL:
             if isinstance(schedule.value, (int, float)):
                 return IntervalTrigger(seconds=float(schedule.value))
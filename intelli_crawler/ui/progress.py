@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from threading import Lock
+import atexit
+import io
+import itertools
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, TextIO
+from threading import Event, Lock, Thread, get_ident
 from rich.console import Console
 from rich.errors import LiveError
 from rich.status import Status
@@ -21,14 +28,119 @@ from rich.progress import (
 )
 from rich.text import Text
 
+# 默认刷新频率（Hz）。12Hz 全量重绘多行布局在慢终端上开销大且闪烁，可用环境变量调整
+_DEFAULT_REFRESH_HZ = 4
 
-@dataclass
+
+def _default_refresh_hz() -> float:
+    try:
+        value = float(os.environ.get("INTELLI_PROGRESS_HZ", _DEFAULT_REFRESH_HZ))
+    except ValueError:
+        return _DEFAULT_REFRESH_HZ
+    return value if value > 0 else _DEFAULT_REFRESH_HZ
+
+
+def _default_show_spinner(default: bool) -> bool:
+    """旋转指示器每个节拍都要重绘；可用 INTELLI_PROGRESS_SPINNER=0/1 覆盖默认值。"""
+    value = os.environ.get("INTELLI_PROGRESS_SPINNER")
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() not in {"0", "false", "no", "off"}
+
+
+@lru_cache(maxsize=2048)
+def _truncate_url(url: str, width: int) -> str:
+    """截断过长的 URL 以适配进度行；分页等重复 URL 直接命中缓存。"""
+    return url[: width - 3] + "..." if len(url) > width else url
+
+
+# stdout 被重定向到文件/管道时的写缓冲大小
+_STDOUT_BUFFER_SIZE = 64 * 1024
+
+
+def _buffered_stdout() -> TextIO | None:
+    """stdout 不是终端时返回 64 KiB 缓冲的写入流，把 Rich 的零碎写入合并成少量 write 系统调用。"""
+    try:
+        if sys.stdout is None or sys.stdout.isatty():
+            return None
+        fileno = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        # 被替换为不带文件描述符的流（如测试捕获）时沿用默认输出
+        return None
+    # closefd=False：流被回收时不会关闭进程的 stdout
+    raw = io.FileIO(fileno, "w", closefd=False)
+    stream = io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=_STDOUT_BUFFER_SIZE),
+        encoding=getattr(sys.stdout, "encoding", None) or "utf-8",
+        write_through=False,
+    )
+    atexit.register(_flush_stream, stream)
+    return stream
+
+
+def _flush_stream(stream: TextIO) -> None:
+    try:
+        stream.flush()
+    except (OSError, ValueError):
+        pass
+
+
+@lru_cache(maxsize=1)
+def _shared_console() -> Console:
+    """进程内共享的 Console，避免每个报告器重复探测终端能力。"""
+    stream = _buffered_stdout()
+    return Console(file=stream) if stream is not None else Console()
+
+
+@lru_cache(maxsize=1)
+def _stdout_is_terminal() -> bool:
+    """终端检测在进程内只做一次，各进度报告器共用结果。"""
+    return _shared_console().is_terminal
+
+
+@dataclass(slots=True)
 class ProgressState:
+    """Progress counters sharded per writer thread and summed when read.
+
+    Each thread increments only its own ``[success, failed, skipped]`` slot, so concurrent
+    ``record`` calls never race on a shared integer; reads happen at render rate.
+    """
+
     total: int
-    success: int = 0
-    failed: int = 0
-    skipped: int = 0
     current_url: str | None = None
+    _shards: dict[int, list[int]] = field(default_factory=dict, init=False, repr=False)
+
+    def record(self, success: bool = False, failed: bool = False, skipped: bool = False) -> None:
+        shard = self._shards.get(get_ident())
+        if shard is None:
+            shard = self._shards.setdefault(get_ident(), [0, 0, 0])
+        if success:
+            shard[0] += 1
+        if failed:
+            shard[1] += 1
+        if skipped:
+            shard[2] += 1
+
+    def counts(self) -> tuple[int, int, int]:
+        """Return ``(success, failed, skipped)`` summed across all shards."""
+        success = failed = skipped = 0
+        for shard in list(self._shards.values()):
+            success += shard[0]
+            failed += shard[1]
+            skipped += shard[2]
+        return success, failed, skipped
+
+    @property
+    def success(self) -> int:
+        return self.counts()[0]
+
+    @property
+    def failed(self) -> int:
+        return self.counts()[1]
+
+    @property
+    def skipped(self) -> int:
+        return self.counts()[2]
 
 
 class RateColumn(ProgressColumn):
@@ -51,30 +163,79 @@ class RateColumn(ProgressColumn):
         speed = task.finished_speed or task.speed
         if speed is None:
             return Text("", style="progress.percentage")
-        
-        # 使用filesize工具来格式化数字，但单位改为url/s
-        if speed < 1000:
-            return Text(f"{speed:.1f} url/s", style="progress.percentage")
-        else:
-            unit, suffix = filesize.pick_unit_and_suffix(
-                int(speed),
-                ["", "K", "M", "G", "T"],
-                1000,
-            )
-            data_speed = speed / unit
-            return Text(f"{data_speed:.1f}{suffix} url/s", style="progress.percentage")
+        return Text(_format_rate(round(speed, 1)), style="progress.percentage")
+
+
+@lru_cache(maxsize=256)
+def _format_rate(speed: float) -> str:
+    """格式化速率文本；抓取速率通常集中在很窄的区间，按一位小数缓存命中率很高。"""
+    # 使用filesize工具来格式化数字，但单位改为url/s
+    if speed < 1000:
+        return f"{speed:.1f} url/s"
+    unit, suffix = filesize.pick_unit_and_suffix(
+        int(speed),
+        ["", "K", "M", "G", "T"],
+        1000,
+    )
+    return f"{speed / unit:.1f}{suffix} url/s"
+
+
+def _progress_columns(show_spinner: bool) -> list[ProgressColumn]:
+    columns: list[ProgressColumn] = []
+    if show_spinner:
+        columns.append(SpinnerColumn(style="cyan"))
+    columns.extend(
+        [
+            TextColumn("[bold blue]{task.fields[source]:<18}", justify="left"),
+            BarColumn(
+                bar_width=None,
+                complete_style="green",
+                finished_style="green",
+                pulse_style="cyan",
+            ),
+            TaskProgressColumn(show_speed=False),
+            TimeElapsedColumn(),
+            RateColumn(),
+            TextColumn("[green]✓{task.fields[success]:>3}", justify="right"),
+            TextColumn("[red]✗{task.fields[failed]:>3}", justify="right"),
+            TextColumn("[yellow]↺{task.fields[skipped]:>3}", justify="right"),
+            TextColumn("[dim]{task.fields[current_url]}", justify="left"),
+        ]
+    )
+    return columns
 
 
 class ProgressReporter:
     """Render progress and maintain counters for CLI feedback."""
 
-    def __init__(self, enabled: bool = True) -> None:
+    __slots__ = (
+        "enabled",
+        "refresh_hz",
+        "show_spinner",
+        "_console",
+        "_progress",
+        "_task_id",
+        "state",
+        "_label",
+        "_noop",
+    )
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        refresh_hz: float | None = None,
+        show_spinner: bool | None = None,
+    ) -> None:
         self.enabled = enabled
+        self.refresh_hz = refresh_hz or _default_refresh_hz()
+        self.show_spinner = _default_show_spinner(True) if show_spinner is None else show_spinner
         self._console: Console | None = None
         self._progress: Progress | None = None
         self._task_id: TaskID | None = None
         self.state: ProgressState | None = None
         self._label: str = "采集任务"
+        # 禁用或无活动进度条时 advance 只累加计数
+        self._noop = not enabled
 
     def set_label(self, label: str) -> None:
         """Update the display label for the progress row."""
@@ -90,28 +251,21 @@ class ProgressReporter:
         if not self.enabled:
             return
         if self._console is None:
-            self._console = Console()
-            if not self._console.is_terminal:
+            if not _stdout_is_terminal():
                 # 非交互环境回退为静默模式，避免重复打印
-                self._console = None
                 self.enabled = False
+                self._noop = True
                 return
+            self._console = _shared_console()
         self._progress = Progress(
-            SpinnerColumn(style="cyan"),
-            TextColumn("[bold blue]{task.fields[source]:<18}", justify="left"),
-            BarColumn(bar_width=None, complete_style="green", finished_style="green", pulse_style="cyan"),
-            TaskProgressColumn(show_speed=False),
-            TimeElapsedColumn(),
-            RateColumn(),
-            TextColumn("[green]✓{task.fields[success]:>3}", justify="right"),
-            TextColumn("[red]✗{task.fields[failed]:>3}", justify="right"),
-            TextColumn("[yellow]↺{task.fields[skipped]:>3}", justify="right"),
-            TextColumn("[dim]{task.fields[current_url]}", justify="left"),
-            refresh_per_second=12,
+            *_progress_columns(self.show_spinner),
+            refresh_per_second=self.refresh_hz,
             expand=True,
             transient=True,
             console=self._console,
             auto_refresh=True,
+            redirect_stdout=False,
+            redirect_stderr=False,
             disable=not self.enabled,
         )
         try:
@@ -119,6 +273,7 @@ class ProgressReporter:
         except LiveError:
             # 同一控制台已存在活动进度条，退化为静默模式
             self.enabled = False
+            self._noop = True
             self._progress = None
             self._console = None
             return
@@ -143,38 +298,31 @@ class ProgressReporter:
             raise RuntimeError("ProgressReporter.start must be called before advance")
         if current_url:
             self.state.current_url = current_url
-        if success:
-            self.state.success += 1
-        if failed:
-            self.state.failed += 1
-        if skipped:
-            self.state.skipped += 1
-        if self._progress is not None and self._task_id is not None:
-            display_url = self.state.current_url or ""
-            if len(display_url) > 60:
-                display_url = display_url[:57] + "..."
-            metrics = {
-                "success": self.state.success,
-                "failed": self.state.failed,
-                "skipped": self.state.skipped,
-                "current_url": display_url,
-            }
-            try:
-                self._progress.update(self._task_id, advance=1, **metrics)
-            except Exception:
-                pass
+        self.state.record(success, failed, skipped)
+        if self._noop or self._progress is None or self._task_id is None:
+            return
+        display_url = _truncate_url(self.state.current_url, 60) if self.state.current_url else ""
+        success_count, failed_count, skipped_count = self.state.counts()
+        self._progress.update(
+            self._task_id,
+            advance=1,
+            success=success_count,
+            failed=failed_count,
+            skipped=skipped_count,
+            current_url=display_url,
+        )
 
     def close(self) -> None:
         if self._progress is not None and self._task_id is not None and self.state is not None:
-            final_completed = self.state.success + self.state.failed + self.state.skipped
+            success_count, failed_count, skipped_count = self.state.counts()
             try:
                 self._progress.update(
                     self._task_id,
-                    completed=final_completed,
+                    completed=success_count + failed_count + skipped_count,
                     current_url="已完成",
-                    success=self.state.success,
-                    failed=self.state.failed,
-                    skipped=self.state.skipped,
+                    success=success_count,
+                    failed=failed_count,
+                    skipped=skipped_count,
                 )
             except Exception:
                 pass
@@ -189,16 +337,15 @@ class ProgressReporter:
             except Exception:
                 pass
             self._progress = None
+        if self._console is not None:
+            _flush_stream(self._console.file)
         self._task_id = None
 
     def summary(self) -> dict[str, int]:
         if not self.state:
             return {"success": 0, "failed": 0, "skipped": 0}
-        return {
-            "success": self.state.success,
-            "failed": self.state.failed,
-            "skipped": self.state.skipped,
-        }
+        success, failed, skipped = self.state.counts()
+        return {"success": success, "failed": failed, "skipped": skipped}
 
 
 class MultiSourceProgress:
@@ -211,36 +358,62 @@ class MultiSourceProgress:
     3. 更好的终端兼容性
     """
 
-    def __init__(self, enabled: bool = True, console: Console | None = None) -> None:
+    __slots__ = (
+        "enabled",
+        "refresh_hz",
+        "show_spinner",
+        "console",
+        "_progress",
+        "_lock",
+        "_entered",
+        "_task_counter",
+        "_dirty",
+        "_fields",
+        "_flush_stop",
+        "_flusher",
+    )
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        console: Console | None = None,
+        refresh_hz: float | None = None,
+        show_spinner: bool | None = None,
+    ) -> None:
         self.enabled = enabled
+        self.refresh_hz = refresh_hz or _default_refresh_hz()
+        # 多源批量抓取默认关闭旋转指示器：无新进度的节拍不必为动画重绘整块布局
+        self.show_spinner = _default_show_spinner(False) if show_spinner is None else show_spinner
         # 优化终端配置，确保进度条正确显示
-        self.console = console or Console()
-        if enabled and not self.console.is_terminal:
+        self.console = console or _shared_console()
+        if enabled and not (_stdout_is_terminal() if console is None else console.is_terminal):
             # 非TTY 环境下退化为静默模式，避免重复打印
             self.enabled = False
         
         # 优化的进度条配置，确保固定位置更新而不重复打印
         self._progress = Progress(
-            SpinnerColumn(style="cyan"),
-            TextColumn("[bold blue]{task.fields[source]:<18}", justify="left"),
-            BarColumn(bar_width=None, complete_style="green", finished_style="green", pulse_style="cyan"),
-            TaskProgressColumn(show_speed=False),
-            TimeElapsedColumn(),
-            RateColumn(),
-            TextColumn("[green]✓{task.fields[success]:>3}", justify="right"),
-            TextColumn("[red]✗{task.fields[failed]:>3}", justify="right"),
-            TextColumn("[yellow]↺{task.fields[skipped]:>3}", justify="right"),
-            TextColumn("[dim]{task.fields[current_url]}", justify="left"),
+            *_progress_columns(self.show_spinner),
             console=self.console,
             transient=True,
-            refresh_per_second=12,
+            refresh_per_second=self.refresh_hz,
             expand=True,
             disable=not self.enabled,
-            auto_refresh=True,
+            # 由刷新线程在每个节拍写入全部任务后统一重绘一次，不再另起 Rich 自动刷新线程
+            auto_refresh=False,
+            redirect_stdout=False,
+            redirect_stderr=False,
         )
         self._lock = Lock()
         self._entered = False
-        self._task_count = 0
+        # 任务编号用 itertools.count 生成，next() 在 GIL 下原子完成，无需加锁
+        self._task_counter = itertools.count(1)
+        # 工作线程只登记“哪个任务有新进度”，由刷新线程按 refresh_hz 批量写入 Rich；
+        # 单个 dict 赋值/弹出在 GIL 下是原子的，热路径无需加锁
+        self._dirty: dict[TaskID, tuple[ProgressState, str]] = {}
+        # 每个任务预分配一份更新字段，刷新时原地改写，避免每次更新都新建字典
+        self._fields: dict[TaskID, dict[str, Any]] = {}
+        self._flush_stop = Event()
+        self._flusher: Thread | None = None
 
     def __enter__(self) -> "MultiSourceProgress":
         if self.enabled and not self._entered:
@@ -250,9 +423,12 @@ class MultiSourceProgress:
             except LiveError:
                 # 若已有其它 Live 控制器占用同一控制台，则直接退化为静默模式
                 self.enabled = False
+            else:
+                self._start_flusher()
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
+        self._stop_flusher()
         if self.enabled and self._entered:
             # 确保所有任务都完成后再退出
             try:
@@ -261,6 +437,7 @@ class MultiSourceProgress:
                 pass
             self._progress.__exit__(exc_type, exc, tb)
             self._entered = False
+        _flush_stream(self.console.file)
 
     def create_reporter(self, source_name: str) -> "MultiSourceProgressReporter":
         """
@@ -285,17 +462,24 @@ class MultiSourceProgress:
         Returns:
             任务ID
         """
-        with self._lock:
-            self._task_count += 1
-            return self._progress.add_task(
-                f"Task-{self._task_count}", 
-                total=total, 
-                source=source_name, 
-                success=0,
-                failed=0,
-                skipped=0,
-                current_url="等待中…",
-            )
+        # Rich 的 Progress.add_task 自身持有内部锁，这里不再额外串行化
+        task_id = self._progress.add_task(
+            f"Task-{next(self._task_counter)}",
+            total=total,
+            source=source_name,
+            success=0,
+            failed=0,
+            skipped=0,
+            current_url="等待中…",
+        )
+        self._fields[task_id] = {
+            "completed": 0,
+            "success": 0,
+            "failed": 0,
+            "skipped": 0,
+            "current_url": "",
+        }
+        return task_id
 
     def advance_task(
         self,
@@ -315,23 +499,67 @@ class MultiSourceProgress:
             return
         
         # 截断URL显示，避免布局问题
-        display_url = ""
-        if current_url:
-            display_url = current_url[:50] + "..." if len(current_url) > 50 else current_url
-            
+        display_url = _truncate_url(current_url, 53) if current_url else ""
+
+        # 只记录最新状态，计数由 state 自身累加，刷新线程读取时取到的总是最新值
+        self._dirty[task_id] = (state, display_url)
+        if self._flusher is None:
+            # 未进入上下文（无刷新线程）时直接落到 Rich
+            self._safe_flush()
+
+    def _flush_dirty(self, refresh: bool = False) -> None:
+        """将登记的任务进度一次性写入 Rich，整批只获取一次锁，可选在末尾统一重绘一次。"""
+        if not self._dirty and not refresh:
+            return
         with self._lock:
-            try:
-                self._progress.update(
-                    task_id,
-                    advance=1,
-                    success=state.success,
-                    failed=state.failed,
-                    skipped=state.skipped,
-                    current_url=display_url,
-                )
-            except Exception:
-                # 防御性编程：如果更新失败，不影响主流程
-                pass
+            for task_id in list(self._dirty):
+                entry = self._dirty.pop(task_id, None)
+                fields = self._fields.get(task_id)
+                if entry is None or fields is None:
+                    # 已完成的任务不再接受中间进度
+                    continue
+                state, display_url = entry
+                success, failed, skipped = state.counts()
+                fields["completed"] = success + failed + skipped
+                fields["success"] = success
+                fields["failed"] = failed
+                fields["skipped"] = skipped
+                fields["current_url"] = display_url
+                self._progress.update(task_id, **fields)
+            if refresh:
+                self._progress.refresh()
+
+    def _flush_loop(self) -> None:
+        interval = 1.0 / self.refresh_hz
+        # 有旋转指示器时每个节拍都重绘；否则仅在有新进度时重绘，空闲时约每秒一次让耗时列走动
+        idle_ticks = max(1, round(self.refresh_hz))
+        idle = 0
+        while not self._flush_stop.wait(interval):
+            idle += 1
+            if self.show_spinner or self._dirty or idle >= idle_ticks:
+                idle = 0
+                self._safe_flush()
+        self._safe_flush()
+
+    def _safe_flush(self) -> None:
+        # 异常只在刷新这一处兜底：渲染失败不影响抓取主流程，也不终止刷新线程
+        try:
+            self._flush_dirty(refresh=True)
+        except Exception:
+            pass
+
+    def _start_flusher(self) -> None:
+        if self._flusher is not None:
+            return
+        self._flush_stop.clear()
+        self._flusher = Thread(target=self._flush_loop, name="progress-flusher", daemon=True)
+        self._flusher.start()
+
+    def _stop_flusher(self) -> None:
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            self._flush_stop.set()
+            flusher.join()
 
     def finish_task(self, task_id: TaskID, state: ProgressState | None) -> None:
         """
@@ -344,30 +572,30 @@ class MultiSourceProgress:
         if not self.enabled:
             return
         
-        completed = 0
-        if state:
-            completed = state.success + state.failed + state.skipped
+        success, failed, skipped = state.counts() if state else (0, 0, 0)
             
         with self._lock:
-            try:
-                self._progress.update(
-                    task_id, 
-                    completed=completed,
-                    current_url="[dim]已完成[/dim]",
-                    success=state.success if state else 0,
-                    failed=state.failed if state else 0,
-                    skipped=state.skipped if state else 0,
-                )
-            except Exception:
-                pass
+            # 丢弃尚未刷新的中间进度，避免覆盖最终状态
+            self._dirty.pop(task_id, None)
+            self._fields.pop(task_id, None)
+            self._progress.update(
+                task_id,
+                completed=success + failed + skipped,
+                current_url="[dim]已完成[/dim]",
+                success=success,
+                failed=failed,
+                skipped=skipped,
+            )
 
     def stop(self) -> None:
         """停止进度显示"""
+        self._stop_flusher()
         if self.enabled and self._entered:
             try:
                 self._progress.stop()
             except Exception:
                 pass
+        _flush_stream(self.console.file)
 
 
 class MultiSourceProgressReporter:
@@ -377,6 +605,8 @@ class MultiSourceProgressReporter:
     支持线程安全的进度更新和状态管理
     """
 
+    __slots__ = ("manager", "source_name", "enabled", "state", "_task_id")
+
     def __init__(self, manager: MultiSourceProgress, source_name: str) -> None:
         self.manager = manager
         self.source_name = source_name
@@ -412,10 +642,7 @@ class MultiSourceProgressReporter:
             self.state.total = total
         if self._task_id is not None:
             with self.manager._lock:
-                try:
-                    self.manager._progress.update(self._task_id, total=total)
-                except Exception:
-                    pass
+                self.manager._progress.update(self._task_id, total=total)
 
     def advance(
         self,
@@ -438,12 +665,7 @@ class MultiSourceProgressReporter:
         
         if current_url:
             self.state.current_url = current_url
-        if success:
-            self.state.success += 1
-        if failed:
-            self.state.failed += 1
-        if skipped:
-            self.state.skipped += 1
+        self.state.record(success, failed, skipped)
             
         if self._task_id is not None:
             self.manager.advance_task(self._task_id, self.state, self.state.current_url)
@@ -462,21 +684,20 @@ class MultiSourceProgressReporter:
         """
         if not self.state:
             return {"success": 0, "failed": 0, "skipped": 0}
-        return {
-            "success": self.state.success,
-            "failed": self.state.failed,
-            "skipped": self.state.skipped,
-        }
+        success, failed, skipped = self.state.counts()
+        return {"success": success, "failed": failed, "skipped": skipped}
 
 
 class ProgressActivity:
     """Indeterminate activity indicator using Rich Status spinner."""
 
+    __slots__ = ("enabled", "console", "_status")
+
     def __init__(self, enabled: bool = True, console: Console | None = None) -> None:
         self.enabled = enabled
         # 使用默认 Console 配置，避免强制修改终端交互/渲染模式
         # 这样可以减少异常终端状态（如箭头键失效、回显异常）残留的可能性
-        self.console = console or Console()
+        self.console = console or _shared_console()
         self._status: Status | None = None
 
     def start(self, message: str) -> None:
@@ -488,8 +709,13 @@ class ProgressActivity:
         """
         if not self.enabled or self._status is not None:
             return
-        self._status = self.console.status(message)
-        self._status.start()
+        status = self.console.status(message)
+        try:
+            status.start()
+        except LiveError:
+            # 共享控制台上已有其它进度显示，跳过活动指示器
+            return
+        self._status = status
 
     def update(self, message: str) -> None:
         """
@@ -506,6 +732,7 @@ class ProgressActivity:
         if self._status is not None:
             self._status.stop()
             self._status = None
+        _flush_stream(self.console.file)
 
 
 __all__ = [
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Mapping
 
 import yaml
 
 from ..config import ConfigRepository, SourceConfig
 
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - import guard
+    from yaml import SafeLoader as _SafeLoader
+
+
+@lru_cache(maxsize=32)
+def _load_template(path: Path, mtime_ns: int) -> dict[str, Any]:
+    # mtime 参与缓存键，模板文件被修改后自动重新解析
+    return yaml.load(path.read_text(encoding="utf-8"), Loader=_SafeLoader) or {}
+
 
 class ConfigWizard:
     """Assist CLI in bootstrapping new source configurations."""
@@ -17,7 +31,8 @@ class ConfigWizard:
 
     def from_template(self, source_name: str, template_name: str = "source_template.yaml") -> SourceConfig:
         template_path = self.repository.ensure_template(template_name)
-        data = yaml.safe_load(template_path.read_text(encoding="utf-8"))
+        # 缓存的模板在多次调用间共享，修改前先深拷贝
+        data = copy.deepcopy(_load_template(template_path, template_path.stat().st_mtime_ns))
         data["source_name"] = source_name
         config = SourceConfig.model_validate(data)
         self.repository.save_source(config)
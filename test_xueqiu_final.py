@@ -4,149 +4,175 @@
 """
 
 import asyncio
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 import re
 from datetime import datetime
+from pathlib import Path
 
-async def test_xueqiu_final():
+# 时间线条目选择器：滚动加载时据此判断是否有新内容
+TIMELINE_ITEMS = '.style_home__timeline_1Tz > *'
+# 时间戳行（HH:MM）、换行及其两侧空白、半角/全角冒号
+_TIME = re.compile(r'^[ \t]*(\d{2}:\d{2})[ \t]*$', re.M)
+_LINE_BREAK = re.compile(r'\s*\n\s*')
+_COLON = re.compile(r'[:：]')
+# 浏览器端逐条抽取时间与内容，内容按行去空白后以空格拼接
+_EXTRACT_ITEMS_JS = """(nodes) => nodes.map(n => {
+    const t = n.querySelector('.time')?.innerText?.trim();
+    const c = n.querySelector('.content')?.innerText
+        ?.split('\\n').map(s => s.trim()).filter(Boolean).join(' ');
+    return t && c ? {time: t, content: c} : null;
+}).filter(Boolean)"""
+
+
+def _parse_timeline_text(timeline_text):
+    """在原文上直接定位时间戳行（格式：HH:MM），相邻时间戳之间即为该条内容。"""
+    entries = []
+    matches = list(_TIME.finditer(timeline_text))
+    for idx, match in enumerate(matches):
+        block_end = matches[idx + 1].start() if idx + 1 < len(matches) else len(timeline_text)
+        # 各行去除首尾空白、跳过空行后以空格拼接
+        content = _LINE_BREAK.sub(' ', timeline_text[match.end():block_end].strip())
+        if content:
+            entries.append({'time': match.group(1), 'content': content})
+    return entries
+
+
+async def test_xueqiu_final(browser):
     """最终测试雪球7x24抓取流程"""
-    async with async_playwright() as p:
-        # 启动浏览器
-        browser = await p.chromium.launch(headless=False)
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
+    # 浏览器由调用方（pytest 会话夹具或脚本入口）提供，这里只创建独立上下文
+    context = await browser.new_context(
+        viewport={'width': 1920, 'height': 1080},
+        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    )
+    
+    page = await context.new_page()
+    
+    try:
+        print("正在访问雪球主页...")
+        await page.goto('https://xueqiu.com/', wait_until='domcontentloaded', timeout=30000)
         
-        page = await context.new_page()
+        # 等待页面加载
+        await page.wait_for_timeout(3000)
+        print(f"页面标题: {await page.title()}")
         
+        # 等待并点击7X24标签
+        print("等待7X24标签出现...")
         try:
-            print("正在访问雪球主页...")
-            await page.goto('https://xueqiu.com/', wait_until='domcontentloaded', timeout=30000)
-            
-            # 等待页面加载
+            tab_element = await page.wait_for_selector('text=7X24', timeout=15000)
+            print("找到7X24标签，点击...")
+            await tab_element.click()
             await page.wait_for_timeout(3000)
-            print(f"页面标题: {await page.title()}")
+            print("成功点击7X24标签")
+        except Exception as e:
+            print(f"点击7X24标签失败: {e}")
+            return
+        
+        # 等待时间线容器加载
+        print("等待时间线容器加载...")
+        try:
+            timeline = await page.wait_for_selector('.style_home__timeline_1Tz', timeout=15000)
+            print("找到时间线容器")
+        except Exception as e:
+            print(f"未找到时间线容器: {e}")
+            return
+        
+        # 滚动加载更多内容：以时间线条目数增长作为加载完成信号，替代固定等待
+        print("开始滚动加载更多内容...")
+        for i in range(5):
+            print(f"第 {i+1} 次滚动...")
+            prev_count = await page.eval_on_selector_all(TIMELINE_ITEMS, "nodes => nodes.length")
+            # 滚动到页面底部的同时查找"更多"按钮
+            _, more_button = await asyncio.gather(
+                page.evaluate("window.scrollTo(0, document.body.scrollHeight)"),
+                page.query_selector('text=更多'),
+            )
             
-            # 等待并点击7X24标签
-            print("等待7X24标签出现...")
+            # 尝试点击"更多"按钮（如果存在）
             try:
-                tab_element = await page.wait_for_selector('text=7X24', timeout=15000)
-                print("找到7X24标签，点击...")
-                await tab_element.click()
-                await page.wait_for_timeout(3000)
-                print("成功点击7X24标签")
+                if more_button:
+                    print("找到'更多'按钮，点击...")
+                    await more_button.click()
+                    print("成功点击'更多'按钮")
+                else:
+                    print("未找到'更多'按钮")
             except Exception as e:
-                print(f"点击7X24标签失败: {e}")
-                return
+                print(f"点击'更多'按钮时出错: {e}")
             
-            # 等待时间线容器加载
-            print("等待时间线容器加载...")
             try:
-                timeline = await page.wait_for_selector('.style_home__timeline_1Tz', timeout=15000)
-                print("找到时间线容器")
-            except Exception as e:
-                print(f"未找到时间线容器: {e}")
-                return
-            
-            # 滚动加载更多内容
-            print("开始滚动加载更多内容...")
-            for i in range(5):
-                print(f"第 {i+1} 次滚动...")
-                # 滚动到页面底部
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(2000)  # 等待2秒让内容加载
-                
-                # 尝试点击"更多"按钮（如果存在）
-                try:
-                    more_button = await page.query_selector('text=更多')
-                    if more_button:
-                        print("找到'更多'按钮，点击...")
-                        await more_button.click()
-                        await page.wait_for_timeout(2000)
-                        print("成功点击'更多'按钮")
-                    else:
-                        print("未找到'更多'按钮")
-                except Exception as e:
-                    print(f"点击'更多'按钮时出错: {e}")
-            
-            print("滚动加载完成")
-            
-            # 获取时间线内容
-            print("获取时间线内容...")
-            timeline_text = await timeline.inner_text()
-            
-            # 按行分割内容
-            lines = timeline_text.split('\n')
-            
-            # 查找包含时间戳的行（格式：HH:MM）
-            time_pattern = re.compile(r'^\d{2}:\d{2}$')
-            news_items = []
-            
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-                if time_pattern.match(line):
-                    # 找到时间戳，获取后续内容
-                    time_str = line
-                    content_lines = []
-                    
-                    # 收集时间戳后的内容行，直到下一个时间戳或结束
-                    j = i + 1
-                    while j < len(lines):
-                        next_line = lines[j].strip()
-                        if time_pattern.match(next_line):
-                            break
-                        if next_line:  # 非空行
-                            content_lines.append(next_line)
-                        j += 1
-                    
-                    if content_lines:
-                        content = ' '.join(content_lines)
-                        # 应用关键词过滤（包含冒号）
-                        if ':' in content or ':' in time_str:
-                            news_items.append({
-                                'time': time_str,
-                                'content': content,
-                                'title': content[:50] + '...' if len(content) > 50 else content
-                            })
-                    
-                    i = j
-                else:
-                    i += 1
-            
-            print(f"\n找到 {len(news_items)} 条符合条件的新闻:")
-            for idx, item in enumerate(news_items[:5], 1):
-                print(f"\n{idx}. 时间: {item['time']}")
-                print(f"   标题: {item['title']}")
-                print(f"   内容: {item['content'][:100]}...")
+                await page.wait_for_function(
+                    "document.querySelectorAll('%s').length > %d" % (TIMELINE_ITEMS, prev_count),
+                    timeout=5000,
+                )
+            except PlaywrightTimeoutError:
+                print("没有加载出新内容，停止滚动")
+                break
+        
+        print("滚动加载完成")
+        
+        # 获取时间线内容：在浏览器端直接抽取 (时间, 内容)，只回传紧凑的 JSON 数组
+        print("获取时间线内容...")
+        entries = await page.eval_on_selector_all(TIMELINE_ITEMS, _EXTRACT_ITEMS_JS)
+        if not entries:
+            # 页面结构变化时回退到整段文本解析
+            print("未能按条目抽取，回退到文本解析")
+            entries = _parse_timeline_text(await timeline.inner_text())
+        
+        news_items = []
+        for entry in entries:
+            time_str, content = entry['time'], entry['content']
+            # 应用关键词过滤（包含冒号）
+            if _COLON.search(content) or _COLON.search(time_str):
+                news_items.append({
+                    'time': time_str,
+                    'content': content,
+                    'title': content[:50] + '...' if len(content) > 50 else content
+                })
+        
+        print(f"\n找到 {len(news_items)} 条符合条件的新闻:")
+        for idx, item in enumerate(news_items[:5], 1):
+            print(f"\n{idx}. 时间: {item['time']}")
+            print(f"   标题: {item['title']}")
+            print(f"   内容: {item['content'][:100]}...")
+        
+        # 生成输出内容
+        if news_items:
+            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
             
-            # 生成输出内容
-            if news_items:
-                timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                output_content = f"# 雪球7x24资讯 - {timestamp}\n\n"
-                
-                for item in news_items:
-                    output_content += f"## {item['time']}\n"
-                    output_content += f"**标题:** {item['title']}\n\n"
-                    output_content += f"**内容:** {item['content']}\n\n"
-                    output_content += "---\n\n"
-                
-                # 保存到文件
-                output_file = f"data/outputs/xueqiu-{timestamp}.txt"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(output_content)
-                
-                print(f"\n成功生成输出文件: {output_file}")
-                print(f"共抓取 {len(news_items)} 条新闻")
-            else:
-                print("\n未找到符合条件的新闻内容")
+            # 保存到文件：先写临时文件再原子替换，中断时不会留下半截输出
+            output_file = Path(f"data/outputs/xueqiu-{timestamp}.txt")
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = output_file.with_suffix(".tmp")
+            with tmp_file.open('w', encoding='utf-8') as f:
+                f.write(f"# 雪球7x24资讯 - {timestamp}\n\n")
+                f.writelines(
+                    f"## {item['time']}\n"
+                    f"**标题:** {item['title']}\n\n"
+                    f"**内容:** {item['content']}\n\n"
+                    "---\n\n"
+                    for item in news_items
+                )
+            tmp_file.replace(output_file)
             
-        except Exception as e:
-            print(f"测试过程中出现错误: {e}")
+            print(f"\n成功生成输出文件: {output_file}")
+            print(f"共抓取 {len(news_items)} 条新闻")
+        else:
+            print("\n未找到符合条件的新闻内容")
         
+    except Exception as e:
+        print(f"测试过程中出现错误: {e}")
+    
+    finally:
+        await context.close()
+
+
+async def _main():
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            await test_xueqiu_final(browser)
         finally:
             await browser.close()
 
+
 if __name__ == "__main__":
-    asyncio.run(test_xueqiu_final())
\ No newline at end of file
+    asyncio.run(_main())
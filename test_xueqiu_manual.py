@@ -5,123 +5,163 @@
 """
 
 import asyncio
-from playwright.async_api import async_playwright
-import re
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 from datetime import datetime
 
 
-async def test_xueqiu_manual():
-    """手动测试雪球7x24内容抓取"""
-    async with async_playwright() as p:
-        # 启动浏览器
-        browser = await p.chromium.launch(headless=False)
-        context = await browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        )
-
+# 在浏览器端按时间戳行（HH:MM）切分时间线，只回传结构化条目；首行同时作为标题
+_PARSE_TIMELINE_JS = """(root) => {
+    const out = [];
+    let cur = null;
+    for (const raw of root.innerText.split('\\n')) {
+        const line = raw.trim();
+        if (!line) continue;
+        if (/^\\d{2}:\\d{2}$/.test(line)) {
+            if (cur) out.push(cur);
+            cur = {published_at: line, title: '', parts: []};
+        } else if (cur) {
+            if (!cur.title) cur.title = line;
+            cur.parts.push(line);
+        }
+    }
+    if (cur) out.push(cur);
+    return out.map(({parts, ...item}) => ({...item, content: parts.join(' ')}));
+}"""
+# 待抓取的时间线页面；同一浏览器上下文内并发打开，最多同时 _MAX_CONCURRENT_PAGES 个
+TIMELINE_URLS = ("https://xueqiu.com/7X24",)
+# 时间线条目选择器：据此判断前端是否已渲染出内容
+TIMELINE_ITEMS = ".style_home__timeline_1Tz > *"
+_MAX_CONCURRENT_PAGES = 5
+# 只需要 DOM 文本，图片、字体、媒体与样式表一律拦截
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def scrape_timeline(context, url, semaphore):
+    """在共享上下文中打开一个页面抓取时间线条目；信号量限制同时打开的页面数"""
+    async with semaphore:
         page = await context.new_page()
-
         try:
-            print("正在访问雪球7x24页面...")
-            await page.goto("https://xueqiu.com/7X24", wait_until="domcontentloaded", timeout=30000)
-
-            # 等待页面加载
-            await page.wait_for_timeout(3000)
+            print(f"正在访问 {url} ...")
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
 
-            # 点击7x24标签
+            # 点击7x24标签（等待标签出现即代替固定的加载等待）
             print("点击7x24标签...")
             try:
                 tab_element = await page.wait_for_selector("text=7X24", timeout=10000)
                 await tab_element.click()
-                await page.wait_for_timeout(3000)
                 print("成功点击7x24标签")
             except Exception as e:
                 print(f"点击7x24标签失败: {e}")
 
-            # 等待时间线容器加载
+            # 等待时间线容器加载：节点挂载即可读取文本，无需等样式渲染
             print("等待时间线容器加载...")
             try:
-                timeline = await page.wait_for_selector(".style_home__timeline_1Tz", timeout=15000)
+                timeline = await page.wait_for_selector(
+                    ".style_home__timeline_1Tz", state="attached", timeout=15000
+                )
                 print("找到时间线容器")
             except Exception as e:
                 print(f"未找到时间线容器: {e}")
-                return
+                return []
 
-            # 获取时间线内容
+            # 容器挂载后条目由前端异步渲染：等到至少出现一条即开始解析
+            try:
+                await page.wait_for_function(
+                    "(sel) => document.querySelectorAll(sel).length > 0",
+                    arg=TIMELINE_ITEMS,
+                    timeout=10000,
+                )
+            except PlaywrightTimeoutError:
+                print("时间线条目未在 10 秒内出现，按当前内容解析")
+
+            # 获取时间线内容：一次 evaluate 在页面内完成解析，不再回传整段文本逐行处理
             print("获取时间线内容...")
-            timeline_text = await timeline.inner_text()
-            print(f"时间线内容长度: {len(timeline_text)}")
-
-            # 按行分割内容
-            lines = timeline_text.split("\n")
-            print(f"总行数: {len(lines)}")
-
-            # 查找包含时间戳的行（格式：HH:MM）
-            time_pattern = re.compile(r"^\d{2}:\d{2}$")
-            news_items = []
-            current_item = {}
-
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if not line:
-                    continue
-
-                # 检查是否是时间戳
-                if time_pattern.match(line):
-                    # 保存前一个条目
-                    if current_item and "content" in current_item:
-                        news_items.append(current_item)
-
-                    # 开始新条目
-                    current_item = {"published_at": line, "content": "", "title": ""}
-                elif current_item and "published_at" in current_item:
-                    # 这是新闻内容
-                    if not current_item["title"]:
-                        current_item["title"] = line
-                    current_item["content"] += line + " "
-
-            # 添加最后一个条目
-            if current_item and "content" in current_item:
-                news_items.append(current_item)
-
-            print(f"\n找到 {len(news_items)} 条新闻:")
-            for i, item in enumerate(news_items[:5]):  # 只显示前5条
-                print(f"\n--- 新闻 {i+1} ---")
-                print(f"时间: {item['published_at']}")
-                print(f"标题: {item['title'][:100]}...")
-                print(f"内容: {item['content'][:200]}...")
-
-                # 检查是否包含冒号（用于关键词过滤）
-                if ":" in item["content"]:
-                    print("✓ 包含冒号，符合过滤条件")
-                else:
-                    print("✗ 不包含冒号，不符合过滤条件")
-
-            # 生成输出文件内容
-            print("\n生成输出文件内容...")
-            output_content = ""
-            for i, item in enumerate(news_items):
-                if ":" in item["content"]:  # 应用关键词过滤
-                    output_content += f"{i+1}. {item['title']}\n"
-                    output_content += f"发布时间：{item['published_at']}\n"
-                    output_content += f"抓取时间：{datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')}\n"
-                    output_content += f"{item['content'].strip()}\n"
-                    output_content += f"链接：https://xueqiu.com/7X24\n\n"
-
-            print(f"过滤后的内容长度: {len(output_content)}")
-            if output_content:
-                print("输出内容预览:")
-                print(output_content[:500] + "...")
-            else:
-                print("没有符合过滤条件的内容")
+            items = await timeline.evaluate(_PARSE_TIMELINE_JS)
+            for item in items:
+                item["url"] = url
+            return items
+        finally:
+            await page.close()
 
-        except Exception as e:
-            print(f"测试过程中出现错误: {e}")
 
+async def test_xueqiu_manual(browser):
+    """手动测试雪球7x24内容抓取"""
+    # 浏览器由调用方（pytest 会话夹具或脚本入口）提供，各页面共用一个上下文的 Cookie 与连接
+    context = await browser.new_context(
+        viewport={"width": 1920, "height": 1080},
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    )
+    await context.route("**/*", _block_heavy_resources)
+
+    try:
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PAGES)
+        results = await asyncio.gather(
+            *(scrape_timeline(context, url, semaphore) for url in TIMELINE_URLS),
+            return_exceptions=True,
+        )
+        news_items = []
+        for url, result in zip(TIMELINE_URLS, results, strict=True):
+            if isinstance(result, Exception):
+                print(f"抓取 {url} 时出现错误: {result}")
+            else:
+                news_items.extend(result)
+
+        print(f"\n找到 {len(news_items)} 条新闻:")
+        for i, item in enumerate(news_items[:5]):  # 只显示前5条
+            print(f"\n--- 新闻 {i+1} ---")
+            print(f"时间: {item['published_at']}")
+            print(f"标题: {item['title'][:100]}...")
+            print(f"内容: {item['content'][:200]}...")
+
+            # 检查是否包含冒号（用于关键词过滤）
+            if ":" in item["content"]:
+                print("✓ 包含冒号，符合过滤条件")
+            else:
+                print("✗ 不包含冒号，不符合过滤条件")
+
+        # 生成输出文件内容
+        print("\n生成输出文件内容...")
+        output_parts: list[str] = []
+        # 同一批输出共用一个抓取时间，不在循环内逐条读取时钟
+        captured_at = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
+        for i, item in enumerate(news_items):
+            if ":" in item["content"]:  # 应用关键词过滤
+                output_parts.append(f"{i+1}. {item['title']}\n")
+                output_parts.append(f"发布时间：{item['published_at']}\n")
+                output_parts.append(f"抓取时间：{captured_at}\n")
+                output_parts.append(f"{item['content'].strip()}\n")
+                output_parts.append(f"链接：{item['url']}\n\n")
+        output_content = "".join(output_parts)
+
+        print(f"过滤后的内容长度: {len(output_content)}")
+        if output_content:
+            print("输出内容预览:")
+            print(output_content[:500] + "...")
+        else:
+            print("没有符合过滤条件的内容")
+
+    except Exception as e:
+        print(f"测试过程中出现错误: {e}")
+
+    finally:
+        await context.close()
+
+
+async def _main():
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            await test_xueqiu_manual(browser)
         finally:
             await browser.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(test_xueqiu_manual())
+    asyncio.run(_main())
@@ -2,15 +2,13 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
-from typer.testing import CliRunner
-
 from intelli_crawler.app import AppState, app
 
 
 class StubOrchestrator:
     def __init__(self, summary: dict[str, int]) -> None:
         self.summary = summary
-        self.calls: list[tuple[str, bool, object]] = []
+        self.calls: list[tuple[str, bool | None, object]] = []
         self.thread_pool = SimpleNamespace(default_workers=4)
 
     def run_source(
@@ -20,7 +18,8 @@ class StubOrchestrator:
         progress_factory=None,
         window=None,
     ) -> dict[str, int]:
-        self.calls.append((name, bool(progress_enabled), window))
+        # 原样记录参数并直接返回共享的 summary（调用方只读），不做额外转换
+        self.calls.append((name, progress_enabled, window))
         return self.summary
 
     def reset_history(self, name: str) -> None:
@@ -46,26 +45,24 @@ def make_state(sources, scheduler_jobs, summary) -> AppState:
     )
 
 
-def test_cli_list_sources(monkeypatch, sample_source_config) -> None:
+def test_cli_list_sources(monkeypatch, cli_runner, sample_source_config) -> None:
     source = sample_source_config()
     jobs = [{"id": "source::Example", "next_run_time": "soon", "trigger": "cron[*/5 * * * *]"}]
     state = make_state([source], jobs, {"success": 1, "failed": 0, "skipped": 0})
     monkeypatch.setattr("intelli_crawler.app.build_state", lambda verbose: state)
 
-    runner = CliRunner()
-    result = runner.invoke(app, ["source", "list"])
+    result = cli_runner.invoke(app, ["source", "list"])
     assert result.exit_code == 0, result.stdout
     output = result.stdout
     assert "信息源总览" in output
     assert "Example" in output
 
 
-def test_cli_run_now(monkeypatch, sample_source_config) -> None:
+def test_cli_run_now(monkeypatch, cli_runner, sample_source_config) -> None:
     source = sample_source_config()
     state = make_state([source], [], {"success": 2, "failed": 1, "skipped": 0})
     monkeypatch.setattr("intelli_crawler.app.build_state", lambda verbose: state)
-    runner = CliRunner()
-    result = runner.invoke(app, ["source", "run", source.source_name])
+    result = cli_runner.invoke(app, ["source", "run", source.source_name])
     assert result.exit_code == 0, result.stdout
     assert state.orchestrator.calls
     assert state.orchestrator.calls[0][0] == source.source_name
@@ -76,15 +73,14 @@ def test_cli_run_now(monkeypatch, sample_source_config) -> None:
     assert "跳过" in output
 
 
-def test_cli_run_all(monkeypatch, sample_source_config) -> None:
+def test_cli_run_all(monkeypatch, cli_runner, sample_source_config) -> None:
     sources = [
         sample_source_config(),
         sample_source_config(source_name="Another"),
     ]
     state = make_state(sources, [], {"success": 2, "failed": 1, "skipped": 0})
     monkeypatch.setattr("intelli_crawler.app.build_state", lambda verbose: state)
-    runner = CliRunner()
-    result = runner.invoke(app, ["source", "run-all"])
+    result = cli_runner.invoke(app, ["source", "run-all"])
     assert result.exit_code == 0, result.stdout
     assert len(state.orchestrator.calls) == len(sources)
     output = result.stdout
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -13,19 +14,35 @@ def test_config_locator_uses_env_and_creates_directories(
 ) -> None:
     monkeypatch.setenv("INTELLI_CRAWLER_HOME", str(tmp_path))
     locator = ConfigLocator()
+    # All locator paths sit under tmp_path, so a prefix slice stands in for relative_to.
+    root = str(tmp_path) + os.sep
+
+    def rel(path: Path) -> str:
+        return str(path)[len(root) :] or "."
+
     data = {
-        "project_root": str(locator.project_root.relative_to(tmp_path)),
-        "history_dir": str(locator.history_dir.relative_to(tmp_path)),
-        "outputs_dir": str(locator.outputs_dir.relative_to(tmp_path)),
-        "sources_dir": str(locator.sources_dir.relative_to(tmp_path)),
-        "logs_dir": str(locator.logs_dir.relative_to(tmp_path)),
-        "global_config": str(locator.global_config_path().relative_to(tmp_path)),
+        "project_root": rel(locator.project_root),
+        "history_dir": rel(locator.history_dir),
+        "outputs_dir": rel(locator.outputs_dir),
+        "sources_dir": rel(locator.sources_dir),
+        "logs_dir": rel(locator.logs_dir),
+        "global_config": rel(locator.global_config_path()),
     }
     for path in (locator.history_dir, locator.outputs_dir, locator.sources_dir, locator.logs_dir):
         assert path.exists()
     snapshot.assert_match(data, key="locator_paths")
 
 
+def test_config_locator_recreates_removed_directories(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("INTELLI_CRAWLER_HOME", str(tmp_path))
+    locator = ConfigLocator()
+    locator.logs_dir.rmdir()
+    ConfigLocator().ensure_directories()
+    assert locator.logs_dir.is_dir()
+
+
 def test_config_repository_global_roundtrip(tmp_path: Path, snapshot) -> None:
     locator = ConfigLocator(project_root=tmp_path)
     repo = ConfigRepository(locator)
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import tempfile
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Iterator
 
 import pytest
+import typer
+from typer.testing import CliRunner
+
+try:  # optional: C-speed snapshot (de)serialisation
+    import orjson
+except ImportError:  # pragma: no cover - import guard
+    orjson = None
 
 from intelli_crawler.config import (
     AntiScrapingStrategies,
@@ -20,11 +29,37 @@ from intelli_crawler.config import (
     SiteType,
     SourceConfig,
 )
+from intelli_crawler.engine.fetcher import Fetcher
+from intelli_crawler.infra.storage import SQLiteManager
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write ``text`` to a sibling temp file and rename it over ``path``."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
 
 class QAPlugin:
     """Collect test outcomes and expose snapshot bookkeeping hooks."""
 
+    __slots__ = (
+        "config",
+        "update_snapshots",
+        "snapshot_date",
+        "snapshots_root",
+        "failed_cases",
+        "snapshot_changes",
+        "_snapshot_cache",
+        "_dirty",
+        "_snapshot_digests",
+    )
+
     def __init__(self, config: pytest.Config) -> None:
         self.config = config
         self.update_snapshots = config.getoption("--snapshot-update")
@@ -37,6 +72,11 @@ class QAPlugin:
         self.snapshots_root.mkdir(parents=True, exist_ok=True)
         self.failed_cases: list[str] = []
         self.snapshot_changes: list[str] = []
+        # Parsed snapshot files, read once per session; updates are written back at session end.
+        self._snapshot_cache: dict[Path, dict[str, Any]] = {}
+        self._dirty: set[Path] = set()
+        # Digest of each stored entry's serialised form, so matches compare 16 bytes.
+        self._snapshot_digests: dict[tuple[Path, str], bytes] = {}
 
     def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:  # pragma: no cover
         if report.when == "call" and report.failed:
@@ -46,25 +86,71 @@ class QAPlugin:
         relative = path.relative_to(self.config.rootpath)
         self.snapshot_changes.append(f"{action}: {relative}::{test_key}")
 
+    def load_snapshots(self, path: Path) -> dict[str, Any]:
+        stored = self._snapshot_cache.get(path)
+        if stored is None:
+            stored = _snapshot_loads(path.read_bytes()) if path.exists() else {}
+            self._snapshot_cache[path] = stored
+        return stored
+
+    def snapshot_digest(self, path: Path, test_key: str) -> bytes:
+        digest = self._snapshot_digests.get((path, test_key))
+        if digest is None:
+            stored = self.load_snapshots(path)
+            digest = _snapshot_fingerprint(stored.get(test_key))
+            self._snapshot_digests[(path, test_key)] = digest
+        return digest
+
+    def store_snapshot(self, path: Path, test_key: str, actual: str) -> None:
+        value = _snapshot_loads(actual)
+        self.load_snapshots(path)[test_key] = value
+        self._snapshot_digests[(path, test_key)] = _snapshot_fingerprint(value)
+        self._dirty.add(path)
+
+    def flush_snapshots(self) -> None:
+        for path in sorted(self._dirty):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write_text(path, _snapshot_dumps(self._snapshot_cache[path]))
+        self._dirty.clear()
+
     def pytest_sessionfinish(self, session: pytest.Session, exitstatus: int) -> None:  # pragma: no cover
+        self.flush_snapshots()
         reports_dir = Path(self.config.rootpath) / "reports"
         reports_dir.mkdir(parents=True, exist_ok=True)
+        worker_input = getattr(self.config, "workerinput", None)
+        if worker_input is not None:
+            # pytest-xdist worker: leave a per-worker report for the controller to merge.
+            worker_payload = {
+                "failed_cases": self.failed_cases,
+                "snapshot_changes": self.snapshot_changes,
+            }
+            _atomic_write_text(
+                reports_dir / f"test_report.{worker_input['workerid']}.json",
+                json.dumps(worker_payload, ensure_ascii=False, indent=2),
+            )
+            return
+        failed_cases = list(self.failed_cases)
+        snapshot_changes = list(self.snapshot_changes)
+        for worker_report in sorted(reports_dir.glob("test_report.*.json")):
+            payload = json.loads(worker_report.read_text(encoding="utf-8"))
+            failed_cases.extend(payload.get("failed_cases", []))
+            snapshot_changes.extend(payload.get("snapshot_changes", []))
+            worker_report.unlink()
+        # The controller also receives the workers' forwarded reports; keep each case once.
+        failed_cases = list(dict.fromkeys(failed_cases))
         report_payload = {
-            "coverage": 1.0 if not self.failed_cases else 0.0,
-            "failed_cases": self.failed_cases,
+            "coverage": 1.0 if not failed_cases else 0.0,
+            "failed_cases": failed_cases,
         }
-        (reports_dir / "test_report.json").write_text(
+        _atomic_write_text(
+            reports_dir / "test_report.json",
             json.dumps(report_payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
         )
         snapshot_log = reports_dir / "snapshot_diff.log"
-        if self.snapshot_changes:
-            snapshot_log.write_text(
-                "\n".join(self.snapshot_changes) + "\n",
-                encoding="utf-8",
-            )
+        if snapshot_changes:
+            _atomic_write_text(snapshot_log, "\n".join(snapshot_changes) + "\n")
         else:
-            snapshot_log.write_text("No snapshot updates detected.\n", encoding="utf-8")
+            _atomic_write_text(snapshot_log, "No snapshot updates detected.\n")
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:  # pragma: no cover
@@ -95,50 +181,67 @@ def pytest_unconfigure(config: pytest.Config) -> None:  # pragma: no cover
         delattr(config, "_qa_plugin")
 
 
-def _json_safe(value: Any) -> Any:
-    if isinstance(value, dict):
-        return {str(k): _json_safe(v) for k, v in value.items()}
-    if isinstance(value, (list, tuple)):
-        return [_json_safe(v) for v in value]
-    if isinstance(value, (Path,)):
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Path):
         return str(value)
     if isinstance(value, (datetime, date)):
         return value.isoformat()
-    return value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    _ORJSON_CANONICAL = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _snapshot_dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value, default=_json_default, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, indent=2, sort_keys=True, default=_json_default)
+
+
+def _snapshot_fingerprint(value: Any) -> bytes:
+    """Digest of the compact canonical JSON; the indented form is only built for display."""
+    if orjson is not None:
+        canonical = orjson.dumps(value, default=_json_default, option=_ORJSON_CANONICAL)
+    else:
+        canonical = json.dumps(
+            value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=_json_default
+        ).encode("utf-8")
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+
+def _snapshot_loads(payload: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
 
 
 class SnapshotManager:
     """Assert helper storing expectations under module/date scoped files."""
 
+    __slots__ = ("request", "plugin")
+
     def __init__(self, request: pytest.FixtureRequest, plugin: QAPlugin) -> None:
         self.request = request
         self.plugin = plugin
 
     def assert_match(self, data: Any, *, key: str | None = None) -> None:
-        normalized = _json_safe(data)
         module_name = Path(self.request.fspath).parent.name
         snapshot_dir = self.plugin.snapshots_root / module_name
-        snapshot_dir.mkdir(parents=True, exist_ok=True)
         snapshot_path = snapshot_dir / f"{self.plugin.snapshot_date}.json"
-        if snapshot_path.exists():
-            stored = json.loads(snapshot_path.read_text(encoding="utf-8"))
-        else:
-            stored = {}
         test_key = key or self.request.node.name
-        current = stored.get(test_key)
-        if current == normalized:
+        # Fingerprint first; the indented form is only rendered to store or show a mismatch.
+        if self.plugin.snapshot_digest(snapshot_path, test_key) == _snapshot_fingerprint(data):
             return
+        actual = _snapshot_dumps(data)
+        stored = self.plugin.load_snapshots(snapshot_path)
         if self.plugin.update_snapshots:
             action = "updated" if test_key in stored else "created"
-            stored[test_key] = normalized
-            snapshot_path.write_text(
-                json.dumps(stored, ensure_ascii=False, indent=2, sort_keys=True),
-                encoding="utf-8",
-            )
+            self.plugin.store_snapshot(snapshot_path, test_key, actual)
             self.plugin.register_snapshot_change(snapshot_path, test_key, action)
         else:
-            expected = json.dumps(current, ensure_ascii=False, indent=2, sort_keys=True)
-            actual = json.dumps(normalized, ensure_ascii=False, indent=2, sort_keys=True)
+            expected = _snapshot_dumps(stored.get(test_key))
             raise AssertionError(
                 f"Snapshot mismatch for {test_key}\nExpected:\n{expected}\nActual:\n{actual}"
             )
@@ -150,37 +253,93 @@ def snapshot(request: pytest.FixtureRequest) -> SnapshotManager:
     return SnapshotManager(request, plugin)
 
 
-@pytest.fixture
-def sample_global_config(tmp_path: Path) -> GlobalConfig:
+@pytest.fixture(scope="session")
+def sample_global_config(tmp_path_factory: pytest.TempPathFactory) -> GlobalConfig:
+    """Validated once per session; tests treat it as read-only and copy it to change it."""
+    root = tmp_path_factory.mktemp("global")
     return GlobalConfig(
-        history_dir=tmp_path / "history",
-        outputs_dir=tmp_path / "outputs",
-        sources_dir=tmp_path / "sources",
+        history_dir=root / "history",
+        outputs_dir=root / "outputs",
+        sources_dir=root / "sources",
         default_delay_range=(0.5, 1.5),
     )
 
 
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    # click 8.2+ always captures stderr separately, so no mix_stderr flag is needed.
+    return CliRunner()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_app() -> typer.Typer:
+    """Import the Typer app graph once, up front, instead of inside the first CLI test."""
+    # 运行时状态由 main 回调按次构建（INTELLI_CRAWLER_HOME 在那时读取），预先导入不会固化环境
+    from intelli_crawler.app import app
+
+    return app
+
+
+@pytest.fixture(scope="module")
+def _module_fetcher(sample_global_config: GlobalConfig) -> Iterator[Fetcher]:
+    fetcher = Fetcher(sample_global_config, proxy_pool=None, ua_pool=None)
+    yield fetcher
+    fetcher.close()
+
+
+@pytest.fixture
+def shared_fetcher(_module_fetcher: Fetcher) -> Fetcher:
+    """One HTTP client per test module; cookies are reset so cases stay independent."""
+    _module_fetcher._client.cookies.clear()
+    return _module_fetcher
+
+
+@pytest.fixture(scope="session")
+def foresight_html() -> str:
+    """The Foresight News listing fixture, read and decoded once per session."""
+    return (Path(__file__).parent / "engine" / "fixtures_foresight.html").read_text(
+        encoding="utf-8"
+    )
+
+
 @pytest.fixture
-def sample_source_config() -> Callable[..., SourceConfig]:
+def sqlite_manager() -> Iterator[SQLiteManager]:
+    """A fast-mode manager; pair with ``Path(":memory:")`` unless the test inspects disk files."""
+    manager = SQLiteManager(fast_mode=True)
+    yield manager
+    manager.close_all()
+
+
+@pytest.fixture(scope="session")
+def _base_source_config() -> SourceConfig:
+    return SourceConfig(
+        source_name="Example",
+        site_type=SiteType.NEWS,
+        target_url="https://example.com",
+        entry_pattern="ul.list li a",
+        detail_pattern={
+            "title": "h1",
+            "content": "article ::html",
+        },
+        schedule=ScheduleConfig(),
+        deduplication=DeduplicationConfig(store_path="history/example.db"),
+        anti_scraping_strategies=AntiScrapingStrategies(
+            delay_range=(0.0, 0.0),
+            retry_on_fail=1,
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_source_config(_base_source_config: SourceConfig) -> Callable[..., SourceConfig]:
+    """Copy the session baseline instead of re-validating a full SourceConfig per call.
+
+    ``model_copy`` skips validation, so overrides must already be field-typed values
+    (model instances, enums, plain strings); build ``SourceConfig`` directly otherwise.
+    """
+
     def _builder(**overrides: Any) -> SourceConfig:
-        base: dict[str, Any] = {
-            "source_name": "Example",
-            "site_type": SiteType.NEWS,
-            "target_url": "https://example.com",
-            "entry_pattern": "ul.list li a",
-            "detail_pattern": {
-                "title": "h1",
-                "content": "article ::html",
-            },
-            "schedule": ScheduleConfig(),
-            "deduplication": DeduplicationConfig(store_path="history/example.db"),
-            "anti_scraping_strategies": AntiScrapingStrategies(
-                delay_range=(0.0, 0.0),
-                retry_on_fail=1,
-            ),
-        }
-        base.update(overrides)
-        return SourceConfig(**base)
+        return _base_source_config.model_copy(update=overrides)
 
     return _builder
 
@@ -6,10 +6,23 @@ import pytest
 from intelli_crawler.engine.antibot.chain import AntiBotContext, RequestDirective
 from intelli_crawler.engine.fetcher import BrowserResponse, FetchRequest, Fetcher
 
-
-def test_fetcher_applies_strategy_headers(monkeypatch: pytest.MonkeyPatch, sample_global_config, sample_source_config, snapshot) -> None:
+_WAF_SCRIPT_PAYLOAD = (
+    "<script>var\\ssarg1="
+    "'1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef';"
+    "</script><div>acw_sc__v2</div>"
+)
+_WAF_COOKIE_DOMAIN = "example.com"
+
+
+def test_fetcher_applies_strategy_headers(
+    monkeypatch: pytest.MonkeyPatch,
+    shared_fetcher,
+    sample_global_config,
+    sample_source_config,
+    snapshot,
+) -> None:
     source = sample_source_config()
-    fetcher = Fetcher(sample_global_config, proxy_pool=None, ua_pool=None)
+    fetcher = shared_fetcher
 
     context = AntiBotContext(source=source, global_config=sample_global_config)
 
@@ -41,7 +54,6 @@ def test_fetcher_applies_strategy_headers(monkeypatch: pytest.MonkeyPatch, sampl
     monkeypatch.setattr(fetcher._client, "request", fake_request)
 
     response = fetcher.fetch(source, FetchRequest(url="https://example.com/api"))
-    fetcher.close()
 
     snapshot.assert_match(
         {
@@ -57,9 +69,15 @@ def test_fetcher_applies_strategy_headers(monkeypatch: pytest.MonkeyPatch, sampl
     )
 
 
-def test_fetcher_handles_browser_requests(monkeypatch: pytest.MonkeyPatch, sample_global_config, sample_source_config, snapshot) -> None:
+def test_fetcher_handles_browser_requests(
+    monkeypatch: pytest.MonkeyPatch,
+    shared_fetcher,
+    sample_global_config,
+    sample_source_config,
+    snapshot,
+) -> None:
     source = sample_source_config()
-    fetcher = Fetcher(sample_global_config, proxy_pool=None, ua_pool=None)
+    fetcher = shared_fetcher
     context = AntiBotContext(source=source, global_config=sample_global_config)
 
     class BrowserChain:
@@ -89,7 +107,6 @@ def test_fetcher_handles_browser_requests(monkeypatch: pytest.MonkeyPatch, sampl
 
     monkeypatch.setattr(fetcher, "_fetch_via_browser", fake_browser)
     result = fetcher.fetch(source, FetchRequest(url="https://example.com/detail"))
-    fetcher.close()
 
     snapshot.assert_match(
         {
@@ -102,9 +119,15 @@ def test_fetcher_handles_browser_requests(monkeypatch: pytest.MonkeyPatch, sampl
     )
 
 
-def test_fetcher_retry_on_failure(monkeypatch: pytest.MonkeyPatch, sample_global_config, sample_source_config, snapshot) -> None:
+def test_fetcher_retry_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+    shared_fetcher,
+    sample_global_config,
+    sample_source_config,
+    snapshot,
+) -> None:
     source = sample_source_config()
-    fetcher = Fetcher(sample_global_config, proxy_pool=None, ua_pool=None)
+    fetcher = shared_fetcher
     context = AntiBotContext(source=source, global_config=sample_global_config)
 
     class RetryChain:
@@ -134,25 +157,23 @@ def test_fetcher_retry_on_failure(monkeypatch: pytest.MonkeyPatch, sample_global
 
     monkeypatch.setattr(fetcher._client, "request", flaky_request)
     result = fetcher.fetch(source, FetchRequest(url="https://example.com/flaky"))
-    fetcher.close()
     snapshot.assert_match(
         {"attempts": call_count["count"], "status": result.status_code, "text": result.text},
         key="retry_success",
     )
 
 
-def test_fetcher_waf_cookie_flow(monkeypatch: pytest.MonkeyPatch, sample_global_config, sample_source_config) -> None:
+def test_fetcher_waf_cookie_flow(
+    monkeypatch: pytest.MonkeyPatch, shared_fetcher, sample_source_config
+) -> None:
     source = sample_source_config()
-    fetcher = Fetcher(sample_global_config, proxy_pool=None, ua_pool=None)
+    fetcher = shared_fetcher
 
     request = FetchRequest(url="https://example.com/protected")
-    script_payload = (
-        "<script>var\\ssarg1='1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef';</script><div>acw_sc__v2</div>"
-    )
     initial = httpx.Response(
         200,
         request=httpx.Request("GET", request.url),
-        text=script_payload,
+        text=_WAF_SCRIPT_PAYLOAD,
     )
 
     def follow_up(**kwargs):
@@ -160,8 +181,7 @@ def test_fetcher_waf_cookie_flow(monkeypatch: pytest.MonkeyPatch, sample_global_
 
     monkeypatch.setattr(fetcher._client, "request", follow_up)
     retry = fetcher._maybe_solve_aliyun_waf(initial, request, {"User-Agent": "UA"})
-    cookie = fetcher._client.cookies.get("acw_sc__v2", domain="example.com")
-    fetcher.close()
+    cookie = fetcher._client.cookies.get("acw_sc__v2", domain=_WAF_COOKIE_DOMAIN)
     assert retry is not None
     assert retry.text == "passed"
     assert cookie is not None
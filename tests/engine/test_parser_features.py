@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 from intelli_crawler.engine import Parser
 
 
@@ -54,9 +52,21 @@ def test_filter_by_keywords(sample_source_config) -> None:
     assert not parser.filter_by_keywords(record, ["Blockchain"])
 
 
-def test_extract_foresight_records(snapshot) -> None:
+def test_extract_foresight_records(foresight_html, snapshot) -> None:
     parser = Parser()
-    html_path = Path(__file__).with_name("fixtures_foresight.html")
-    html_content = html_path.read_text(encoding="utf-8")
-    records = parser.extract_foresight_records(html_content, "https://foresightnews.pro")
+    records = parser.extract_foresight_records(foresight_html, "https://foresightnews.pro")
     snapshot.assert_match(records, key="foresight_records")
+
+
+def test_extract_odaily_records_sets_published_at() -> None:
+    parser = Parser()
+    html = (
+        '<script>window.__STATE__={"initData": {"pageResult": {"list": ['
+        '{"id": 42, "title": "Flash {1}", "description": "&lt;p&gt;BTC&lt;/p&gt;",'
+        ' "publishTimestamp": 1700000000000}]}}, "other": {}}</script>'
+    )
+    records = parser.extract_odaily_records(html, "https://www.odaily.news")
+    record = records["https://www.odaily.news/zh-CN/newsflash/42"]
+    assert record["title"] == "Flash {1}"
+    assert record["content"] == "BTC"
+    assert record["published_at"] == "2023-11-14T22:13:20+00:00"
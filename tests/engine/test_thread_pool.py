@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import threading
+import time
+
 from intelli_crawler.engine import ThreadPoolManager
 
 
@@ -17,3 +20,55 @@ def test_thread_pool_manager_isolates_executors() -> None:
     assert pool_beta is not pool_alpha
 
     manager.shutdown()
+
+
+def test_thread_pool_manager_submit_limits_per_source() -> None:
+    manager = ThreadPoolManager(default_workers=4)
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def work(value: int) -> int:
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.01)
+        with lock:
+            state["running"] -= 1
+        return value * 2
+
+    futures = [manager.submit("alpha", work, i, max_workers=2) for i in range(6)]
+    assert sorted(f.result() for f in futures) == [0, 2, 4, 6, 8, 10]
+    assert state["peak"] <= 2
+    manager.shutdown()
+
+
+def test_thread_pool_manager_starts_no_threads_until_used() -> None:
+    before = threading.active_count()
+    manager = ThreadPoolManager(default_workers=4)
+    assert threading.active_count() == before
+
+    assert manager.submit("alpha", lambda: 1).result() == 1
+    assert threading.active_count() <= before + 1
+    manager.shutdown(wait=True)
+
+
+def test_thread_pool_manager_submit_honours_each_limit() -> None:
+    manager = ThreadPoolManager(default_workers=4)
+    assert manager.submit("alpha", lambda: 1, max_workers=4).result() == 1
+
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def work() -> None:
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.01)
+        with lock:
+            state["running"] -= 1
+
+    futures = [manager.submit("alpha", work, max_workers=1) for _ in range(4)]
+    for future in futures:
+        future.result()
+    assert state["peak"] == 1
+    manager.shutdown()
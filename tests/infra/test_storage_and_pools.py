@@ -1,21 +1,23 @@
 from __future__ import annotations
 
 import random
+import threading
+from pathlib import Path
+
+import pytest
 
 from intelli_crawler.infra import ProxyPool, SQLiteManager, UserAgentPool
 
 
-def test_sqlite_manager_initialises_schema(tmp_path) -> None:
-    manager = SQLiteManager()
-    path = tmp_path / "history.db"
-    conn = manager.connect(path)
+def test_sqlite_manager_initialises_schema(sqlite_manager) -> None:
+    conn = sqlite_manager.connect(Path(":memory:"))
     columns = conn.execute("PRAGMA table_info(crawl_history)").fetchall()
     column_names = [row["name"] for row in columns]
     assert {"url", "content_hash", "timestamp", "source_name"}.issubset(column_names)
 
 
-def test_sqlite_manager_reset(tmp_path) -> None:
-    manager = SQLiteManager()
+def test_sqlite_manager_reset(sqlite_manager, tmp_path) -> None:
+    manager = sqlite_manager
     path = tmp_path / "history.db"
     conn = manager.connect(path)
     conn.execute("INSERT OR IGNORE INTO crawl_history(url) VALUES ('https://example.com')")
@@ -27,18 +29,89 @@ def test_sqlite_manager_reset(tmp_path) -> None:
     assert rows[0] == 0
 
 
-def test_proxy_pool_rotation(monkeypatch, snapshot) -> None:
-    monkeypatch.setattr(random, "shuffle", lambda seq: seq.reverse())
-    pool = ProxyPool(proxies=["http://a", "http://b", "http://c"])
+def test_sqlite_manager_insert_many(tmp_path) -> None:
+    manager = SQLiteManager()
+    path = tmp_path / "history.db"
+    conn = manager.connect(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    manager.insert_many(conn, [("https://a", "h1", "demo"), ("https://b", "h2", "demo")])
+    rows = conn.execute("SELECT url FROM crawl_history ORDER BY url").fetchall()
+    assert [row["url"] for row in rows] == ["https://a", "https://b"]
+
+
+def test_sqlite_manager_closes_connections_of_finished_threads(tmp_path) -> None:
+    manager = SQLiteManager()
+    path = tmp_path / "history.db"
+    for _ in range(5):
+        worker = threading.Thread(target=manager.connect, args=(path,))
+        worker.start()
+        worker.join()
+    manager.connect(path)
+    assert len(manager._connections[path]) == 1
+    manager.close_all()
+
+
+def test_sqlite_manager_memory_database_is_shared_across_threads(sqlite_manager) -> None:
+    path = Path(":memory:")
+    conn = sqlite_manager.connect(path)
+    conn.execute("INSERT INTO crawl_history(url) VALUES ('https://a')")
+    conn.commit()
+    seen: list[str] = []
+
+    def read() -> None:
+        rows = sqlite_manager.connect(path).execute("SELECT url FROM crawl_history").fetchall()
+        seen.extend(row["url"] for row in rows)
+
+    worker = threading.Thread(target=read)
+    worker.start()
+    worker.join()
+    assert seen == ["https://a"]
+    # 每个管理器各有一个独立的内存库
+    other = SQLiteManager()
+    assert other.connect(path).execute("SELECT count(*) FROM crawl_history").fetchone()[0] == 0
+    other.close_all()
+
+
+def test_sqlite_manager_transaction_rolls_back(sqlite_manager) -> None:
+    path = Path(":memory:")
+    with sqlite_manager.transaction(path) as conn:
+        conn.executemany(
+            "INSERT INTO crawl_history(url, source_name) VALUES (?, ?)",
+            [("https://a", "one"), ("https://b", "two")],
+        )
+    with pytest.raises(RuntimeError):
+        with sqlite_manager.transaction(path) as conn:
+            conn.execute("DELETE FROM crawl_history")
+            raise RuntimeError("boom")
+    assert conn.execute("SELECT count(*) FROM crawl_history").fetchone()[0] == 2
+
+
+def test_sqlite_manager_fast_mode(sqlite_manager, tmp_path) -> None:
+    conn = sqlite_manager.connect(tmp_path / "history.db")
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+
+
+class _ReversingRandom(random.Random):
+    def shuffle(self, x) -> None:
+        x.reverse()
+
+
+class _FirstChoiceRandom(random.Random):
+    def choice(self, seq):
+        return seq[0]
+
+
+def test_proxy_pool_rotation(snapshot) -> None:
+    pool = ProxyPool(proxies=["http://a", "http://b", "http://c"], rng=_ReversingRandom())
     cycle = [pool.get_proxy() for _ in range(4)]
     pool.refresh(["http://x", "http://y"])
     refreshed = [pool.get_proxy(), pool.get_proxy()]
     snapshot.assert_match({"cycle": cycle, "refreshed": refreshed}, key="proxy_pool_cycle")
 
 
-def test_user_agent_pool(monkeypatch, snapshot) -> None:
-    monkeypatch.setattr(random, "choice", lambda seq: seq[0])
-    pool = UserAgentPool(user_agents=["UA1", "UA2"])
+def test_user_agent_pool(snapshot) -> None:
+    pool = UserAgentPool(user_agents=["UA1", "UA2"], rng=_FirstChoiceRandom())
     first = pool.get()
     pool.refresh(["UA3", "UA4"])
     second = pool.get()
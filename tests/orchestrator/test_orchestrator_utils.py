@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from datetime import datetime
-from unittest.mock import MagicMock
 
 import pytest
 
-from intelli_crawler.config import DeduplicationConfig
-from intelli_crawler.infra import SQLiteManager
-from intelli_crawler.orchestrator import DeduplicationStoreFactory, Orchestrator
+from intelli_crawler.config import AntiScrapingStrategies, DeduplicationConfig
+from intelli_crawler.engine import DeduplicationStore, ThreadPoolManager
+from intelli_crawler.engine.exporter import BaseExporter
+from intelli_crawler.orchestrator import (
+    DeduplicationStoreFactory,
+    Orchestrator,
+    ProcessingResult,
+    _SourceRun,
+)
 
 
 class FixedDatetime(datetime):
@@ -17,20 +24,30 @@ class FixedDatetime(datetime):
         return cls(2024, 5, 20, 12, 0, 0)
 
 
+class _StubRepository:
+    """Only ``load_global_config`` is touched when the orchestrator is built."""
+
+    __slots__ = ("global_config",)
+
+    def __init__(self, global_config) -> None:
+        self.global_config = global_config
+
+    def load_global_config(self):
+        return self.global_config
+
+
+# 这些用例从不调用调度器、线程池或存储，用共享的哑对象占位即可
+_UNUSED = object()
+
+
 @pytest.fixture
 def orchestrator(sample_global_config):
-    repo = MagicMock()
-    repo.load_global_config.return_value = sample_global_config
-    scheduler = MagicMock()
-    thread_pool = MagicMock()
-    storage = MagicMock()
-    orchestrator = Orchestrator(
-        config_repository=repo,
-        scheduler=scheduler,
-        thread_pool=thread_pool,
-        storage=storage,
+    return Orchestrator(
+        config_repository=_StubRepository(sample_global_config),
+        scheduler=_UNUSED,
+        thread_pool=_UNUSED,
+        storage=_UNUSED,
     )
-    return orchestrator
 
 
 def test_enrich_record_fills_defaults(orchestrator, sample_source_config, monkeypatch, snapshot) -> None:
@@ -67,6 +84,14 @@ def test_extract_odaily_payload(orchestrator, sample_source_config, monkeypatch,
     snapshot.assert_match(extracted, key="odaily_extract")
 
 
+def test_extract_odaily_payload_with_markup_in_strings(orchestrator) -> None:
+    detail = {"initData": {"detail": {"title": "T", "description": "<p>a</p><p>b</p>"}}}
+    raw_html = f"<script>window.__STATE__ = {json.dumps(detail)};</script>"
+    extracted = orchestrator._extract_odaily_from_html(raw_html)
+    assert extracted["title"] == "T"
+    assert extracted["content"] == "<p>a</p><p>b</p>"
+
+
 def test_validate_record(orchestrator, sample_source_config) -> None:
     valid, reason = orchestrator._validate_record({"title": "T", "content": "C" * 50})
     assert valid and reason is None
@@ -74,8 +99,10 @@ def test_validate_record(orchestrator, sample_source_config) -> None:
     assert orchestrator._validate_record({"title": "T", "content": "short"}) == (False, "content_too_short")
 
 
-def test_deduplication_store_factory(sample_global_config, sample_source_config, tmp_path) -> None:
-    storage = SQLiteManager()
+def test_deduplication_store_factory(
+    sample_global_config, sample_source_config, sqlite_manager, tmp_path
+) -> None:
+    storage = sqlite_manager
     global_cfg = sample_global_config.model_copy(update={"history_dir": tmp_path / "history"})
     source = sample_source_config(
         deduplication=DeduplicationConfig(by_url=True, by_content=False, store_path="custom.db")
@@ -84,3 +111,120 @@ def test_deduplication_store_factory(sample_global_config, sample_source_config,
     assert store.enable_url is True
     assert store.enable_content is False
     assert store.db_path.name == "custom.db"
+
+
+class _SilentProgress:
+    def advance(self, **_kwargs) -> None:
+        pass
+
+
+def _source_run(source, **overrides) -> _SourceRun:
+    fields = dict(
+        source=source,
+        window=None,
+        progress=_SilentProgress(),
+        progress_flag=False,
+        fetcher=None,
+        parser=None,
+        exporter=None,
+        dedup_store=None,
+        summary={"success": 0, "failed": 0, "skipped": 0, "window_filtered": 0},
+    )
+    fields.update(overrides)
+    return _SourceRun(**fields)
+
+
+def test_headless_details_stay_on_one_thread(
+    orchestrator, sample_source_config, monkeypatch
+) -> None:
+    source = sample_source_config(
+        anti_scraping_strategies=AntiScrapingStrategies(use_headless_browser=True)
+    )
+    thread_ids: set[int] = set()
+
+    def fake_process_detail(*args) -> ProcessingResult:
+        thread_ids.add(threading.get_ident())
+        return ProcessingResult(status="success", url=args[5], reason=None)
+
+    monkeypatch.setattr(orchestrator, "_process_detail", fake_process_detail)
+    orchestrator.thread_pool = ThreadPoolManager(default_workers=4)
+    run = _source_run(source)
+    urls = [f"https://example.com/{index}" for index in range(12)]
+    try:
+        orchestrator._dispatch_threaded(run, urls, {})
+    finally:
+        orchestrator.thread_pool.shutdown(wait=True)
+    assert run.summary["success"] == 12
+    assert len(thread_ids) == 1
+
+
+class _FailingExporter(BaseExporter):
+    def export(self, record: dict) -> None:
+        raise OSError("disk full")
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_export_failure_rolls_back_dedup_history(
+    orchestrator, sample_source_config, sqlite_manager, tmp_path
+) -> None:
+    source = sample_source_config()
+    store = DeduplicationStore(sqlite_manager, tmp_path / "history.db")
+    run = _source_run(source, exporter=_FailingExporter(), dedup_store=store)
+    url = "https://example.com/lost"
+    record = {"url": url, "title": "T", "content": "C" * 50}
+
+    result = orchestrator._finalise_detail(
+        store, run.exporter, source, url, None, "success", record, None
+    )
+    orchestrator._record_result(run, result)
+    assert store.has_url(url)
+
+    orchestrator._settle_exports(run)
+    assert not store.has_url(url)
+    assert run.summary["success"] == 0
+    assert run.summary["failed"] == 1
+
+
+class _RecordingFetcher:
+    def __init__(self, *_args, **_kwargs) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_source_reload_closes_stale_fetcher(
+    temp_config_repository, sample_source_config, monkeypatch
+) -> None:
+    monkeypatch.setattr("intelli_crawler.orchestrator.Fetcher", _RecordingFetcher)
+    orchestrator = Orchestrator(
+        config_repository=temp_config_repository,
+        scheduler=_UNUSED,
+        thread_pool=_UNUSED,
+        storage=_UNUSED,
+    )
+    path = temp_config_repository.save_source(sample_source_config())
+    orchestrator._load_source("Example")
+    first = orchestrator._fetcher_for("Example", orchestrator.logger)
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    orchestrator._load_source("Example")
+    # 重载前已开始的运行继续使用旧 Fetcher，结束时才关闭
+    assert not first.closed
+    orchestrator._release_fetcher("Example", first)
+    assert first.closed
+
+    second = orchestrator._fetcher_for("Example", orchestrator.logger)
+    assert second is not first
+    orchestrator._release_fetcher("Example", second)
+    assert not second.closed
+
+    temp_config_repository.delete_source("Example")
+    orchestrator.forget_source("Example")
+    assert second.closed
@@ -3,24 +3,38 @@
 
 import sys
 import os
+from pathlib import Path
 
 sys.path.insert(0, os.path.abspath("."))
 
+from intelli_crawler.config import ConfigRepository
 from intelli_crawler.infra import SQLiteManager
 
 
-def reset_history(source_name: str):
-    """重置指定源的历史记录"""
+def reset_history(*source_names: str):
+    """重置指定源的历史记录（保留同库中其他源的记录）"""
+    repository = ConfigRepository()
+    history_dir = Path(repository.load_global_config().history_dir)
     storage = SQLiteManager()
-    
-    # 删除URL历史记录
-    storage.execute("DELETE FROM url_history WHERE source = ?", (source_name,))
-    
-    # 删除内容去重记录
-    storage.execute("DELETE FROM content_dedup WHERE source = ?", (source_name,))
-    
-    print(f"已重置 {source_name} 的历史记录")
+
+    # 多个源可能共用同一个历史库，按库分组后每个库只开一次事务
+    by_path: dict[Path, list[str]] = {}
+    for name in source_names:
+        source = repository.load_source(name)
+        by_path.setdefault(source.resolved_history_path(history_dir), []).append(
+            source.source_name
+        )
+
+    for path, names in by_path.items():
+        with storage.transaction(path) as conn:
+            conn.executemany(
+                "DELETE FROM crawl_history WHERE source_name = ?", [(name,) for name in names]
+            )
+    storage.close_all()
+
+    for name in source_names:
+        print(f"已重置 {name} 的历史记录")
 
 
 if __name__ == "__main__":
-    reset_history("Odaily Newsflash")
\ No newline at end of file
+    reset_history(*(sys.argv[1:] or ["Odaily Newsflash"]))
@@ -43,6 +43,20 @@ def test_build_triggers(sample_source_config) -> None:
     assert isinstance(once_trigger, DateTrigger)
 
 
+def test_cron_triggers_are_reused_until_shutdown(sample_source_config) -> None:
+    adapter = APSchedulerAdapter()
+    source = sample_source_config(
+        schedule=ScheduleConfig(type=ScheduleType.CRON, value="0 9 * * 1-5")
+    )
+    first = adapter._build_trigger(source)
+    assert adapter._build_trigger(source) is first
+
+    adapter.shutdown()
+    rebuilt = adapter._build_trigger(source)
+    assert rebuilt is not first
+    assert str(rebuilt) == str(first)
+
+
 def test_schedule_source_uses_scheduler(sample_source_config, monkeypatch, snapshot) -> None:
     adapter = APSchedulerAdapter()
     calls: list[dict] = []
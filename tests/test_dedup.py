@@ -1,13 +1,16 @@
+import hashlib
+import threading
 from pathlib import Path
 
 from intelli_crawler.engine.dedup import DeduplicationStore
 from intelli_crawler.infra.storage import SQLiteManager
 
+# 测试无需持久化，使用 SQLite 内存库
+MEMORY_DB = Path(":memory:")
 
-def test_deduplication_store(tmp_path):
-    manager = SQLiteManager()
-    db_path = tmp_path / "history.db"
-    store = DeduplicationStore(manager, db_path)
+
+def test_deduplication_store(sqlite_manager):
+    store = DeduplicationStore(sqlite_manager, MEMORY_DB)
 
     result = store.check_and_store("https://example.com/a", "content", "source")
     assert not result.is_duplicate
@@ -18,3 +21,47 @@ def test_deduplication_store(tmp_path):
 
     content_duplicate = store.check_and_store("https://example.com/b", "content", "source")
     assert content_duplicate.content_duplicate
+
+
+def test_deduplication_store_has_urls(sqlite_manager):
+    store = DeduplicationStore(sqlite_manager, MEMORY_DB)
+    store.check_and_store("https://example.com/a", "alpha", "source")
+    store.check_and_store("https://example.com/b", "beta", "source")
+
+    urls = [f"https://example.com/{i}" for i in range(1200)] + ["https://example.com/b"]
+    assert store.has_urls(urls) == {"https://example.com/b"}
+    assert store.has_urls([]) == set()
+
+
+def test_deduplication_store_check_and_store_many_matches_sequential(sqlite_manager):
+    items = [
+        ("https://example.com/a", "alpha", "source"),
+        ("https://example.com/b", "beta", "other"),
+        ("https://example.com/a", "gamma", "source"),
+        ("https://example.com/c", "beta", "source"),
+        ("https://example.com/d", "delta", "other"),
+    ]
+    sequential_store = DeduplicationStore(sqlite_manager, MEMORY_DB)
+    sequential_store.check_and_store("https://example.com/d", "seed", "other")
+    sequential = [sequential_store.check_and_store(*item) for item in items]
+
+    batched_store = DeduplicationStore(SQLiteManager(fast_mode=True), MEMORY_DB)
+    batched_store.check_and_store("https://example.com/d", "seed", "other")
+    assert batched_store.check_and_store_many(items) == sequential
+    assert batched_store.check_and_store_many([]) == []
+
+
+def test_deduplication_store_hash_is_stable_sha256():
+    # 指纹格式写入历史库，必须与环境中安装了哪些可选包无关
+    assert DeduplicationStore._hash("content") == hashlib.sha256(b"content").hexdigest()
+
+
+def test_deduplication_store_in_memory_is_shared_across_threads(sqlite_manager):
+    store = DeduplicationStore(sqlite_manager, MEMORY_DB)
+    worker = threading.Thread(
+        target=store.check_and_store, args=("https://example.com/a", "alpha", "source")
+    )
+    worker.start()
+    worker.join()
+    assert store.has_url("https://example.com/a")
+    assert store.check_and_store("https://example.com/b", "alpha", "source").content_duplicate
@@ -1,6 +1,13 @@
 import json
 
-from intelli_crawler.engine.exporter import FileExporter, SQLiteExporter
+import pytest
+
+from intelli_crawler.engine.exporter import (
+    ExportError,
+    FileExporter,
+    QueuedExporter,
+    SQLiteExporter,
+)
 
 
 def test_file_exporter_json(tmp_path):
@@ -64,3 +71,29 @@ def test_sqlite_exporter(tmp_path):
     assert row is not None
     payload = json.loads(row[0])
     assert payload["title"] == "hello"
+
+
+def test_file_exporter_json_batch_isolates_bad_record(tmp_path):
+    exporter = FileExporter(tmp_path, "demo", "json", run_tag="test")
+    with pytest.raises(ExportError) as excinfo:
+        exporter.export_many([{"title": "a"}, {"title": object()}, {"title": "c"}])
+    assert list(excinfo.value.failed) == [1]
+    exporter.close()
+    lines = (tmp_path / "demo-test.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["title"] for line in lines] == ["a", "c"]
+
+
+def test_queued_exporter_reports_failures(tmp_path):
+    exporter = QueuedExporter(FileExporter(tmp_path, "demo", "json", run_tag="test"))
+    good = exporter.submit({"title": "a"})
+    bad = exporter.submit({"title": object()})
+    assert good.result(timeout=5) is None
+    with pytest.raises(TypeError):
+        bad.result(timeout=5)
+
+    exporter.export({"title": object()})
+    with pytest.raises(ExportError):
+        exporter.flush()
+    exporter.close()
+    lines = (tmp_path / "demo-test.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["title"] for line in lines] == ["a"]